@@ -4,6 +4,7 @@ import logging
 from agents.base_agent import BaseAgent
 from config.settings import settings
 from core.redis_client import redis_client
+from core.tracing import start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,10 @@ class AlphaVantageAgent(BaseAgent):
         self.pairs = pairs or ["EUR/USD", "GBP/USD", "USD/JPY"]
         self.api_keys = settings.ALPHA_VANTAGE_KEYS
         self.current_key_idx = 0
+        # IndicatorAgent computing RSI from local bars (set by MainBrain when
+        # bar_agent + indicator_agent run); polling stops per pair once it is warm
+        self.rsi_source = None
+        self.local_pairs = set()
 
     def get_next_key(self):
         if not self.api_keys:
@@ -28,12 +33,25 @@ class AlphaVantageAgent(BaseAgent):
         if not self.api_keys:
             logger.error("❌ No Alpha Vantage API keys found!")
             return
+        pairs = [pair for pair in self.pairs if not self.rsi_is_local(pair)]
+        if not pairs:
+            return
 
         async with aiohttp.ClientSession() as session:
-            for pair in self.pairs:
+            for pair in pairs:
                 await self.fetch_rsi(session, pair)
                 await asyncio.sleep(2) # Avoid rate limits
 
+    def rsi_is_local(self, pair):
+        """True once the local indicator agent has a warm RSI for the pair."""
+        if pair in self.local_pairs:
+            return True
+        if self.rsi_source and self.rsi_source.rsi_warm(pair):
+            self.local_pairs.add(pair)
+            logger.info(f"📈 {pair} RSI now computed locally, stopping Alpha Vantage polling")
+            return True
+        return False
+
     async def fetch_rsi(self, session, pair):
         """Fetch RSI for a pair."""
         key = self.get_next_key()
@@ -52,12 +70,12 @@ class AlphaVantageAgent(BaseAgent):
                     await self.log(f"📊 {pair} RSI: {rsi_val}")
                     
                     # Publish to Redis
-                    await redis_client.publish(f"technical:{pair}", {
+                    await redis_client.publish(f"technical:{pair}", start_trace({
                         "pair": pair,
                         "indicator": "RSI",
                         "value": float(rsi_val),
                         "timestamp": last_refresh
-                    })
+                    }, "fetch"))
                 elif "Note" in data:
                     logger.warning(f"⚠️ Alpha Vantage Rate Limit: {data['Note']}")
                     
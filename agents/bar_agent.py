@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from agents.base_agent import BaseAgent
+from config.settings import settings
+from core.bars import BarAggregator
+from core.redis_client import redis_client
+from utils.symbols import normalize_pair
+from core.tracing import now_ms, continue_trace
+
+logger = logging.getLogger(__name__)
+
+class BarAgent(BaseAgent):
+    """Agent to build shared OHLCV bars from ticks and publish each bar close."""
+
+    def __init__(self):
+        super().__init__(name="bar_agent", loop_interval=1)
+        self.aggregator = BarAggregator(settings.BAR_TIMEFRAMES, settings.BAR_HISTORY, settings.BAR_CLOSE_GRACE_MS)
+        self.pubsub = None
+        self.task = None
+        self.published = 0
+
+    async def start(self):
+        self.pubsub = await redis_client.subscribe("ticks:*", "feed_gaps", group=self.name)
+        await super().start()
+        self.task = asyncio.create_task(self.consume())
+
+    async def stop(self):
+        await super().stop()
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        if self.pubsub:
+            await self.pubsub.close()
+
+    async def run(self):
+        """Close bars whose period ended even if no new tick arrived."""
+        for symbol, tf, bar in self.aggregator.flush(now_ms()):
+            await self.publish(symbol, tf, bar)
+
+    async def consume(self):
+        """Wait for ticks, then handle everything already pending."""
+        while self.running:
+            try:
+                message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                while message is not None:
+                    await self.handle(message)
+                    message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ {self.name} Error: {e}")
+                await asyncio.sleep(1)
+
+    async def handle(self, message):
+        if message['type'] not in ('message', 'pmessage'):
+            return
+        data = redis_client.decode(message)
+        if not isinstance(data, dict):
+            return
+
+        if message['channel'] == "feed_gaps":
+            marked = self.aggregator.mark_gap(data.get('symbols', []), data['start'], data['end'])
+            await self.log(f"🕳️ Marked {marked} bars dirty for feed gap {data['start']}-{data['end']}", level="WARNING")
+            return
+
+        symbol = data.get('symbol')
+        if not symbol:
+            return
+        # Frame-batched ticks carry every trade; older producers only the last price
+        trades = data.get('trades') or [[data['timestamp'], data['price'], 0.0]]
+        trace = data.get('trace')
+        self.aggregator.observe_lag(symbol, now_ms() - trades[-1][0])
+        for ts, price, volume in trades:
+            for tf, bar in self.aggregator.on_tick(symbol, int(ts), float(price), float(volume or 0.0), trace):
+                await self.publish(symbol, tf, bar)
+
+    async def publish(self, symbol, tf, bar):
+        bar["symbol"] = symbol
+        bar["pair"] = normalize_pair(symbol)
+        bar["tf"] = tf
+        # The newest tick's trace continues through the bar (tick -> bar -> indicator -> signal)
+        continue_trace(bar, {"trace": bar.pop("trace")}, "bar")
+        await redis_client.publish_batched(f"bars:{tf}:{symbol}", bar)
+        self.published += 1
@@ -3,7 +3,8 @@ import asyncio
 import logging
 import traceback
 from abc import ABC, abstractmethod
-from core.database import db
+from datetime import datetime
+from core.bulk_writer import log_writer
 from core.redis_client import redis_client
 import json
 import os
@@ -92,13 +93,8 @@ class BaseAgent:
 
     async def log(self, message, level="INFO"):
         """Log to database and console."""
-        print(f"[{self.name}] {message}")  # Console
+        # Console/dashboard via logging (queued handler in run.py), not a blocking print
+        logger.log(getattr(logging, level, logging.INFO), f"[{self.name}] {message}")
         
-        # Async log to DB (fire and forget)
-        try:
-            await db.execute(
-                "INSERT INTO logs (level, message, agent_id) VALUES ($1, $2, $3)",
-                level, message, self.name
-            )
-        except Exception as e:
-            print(f"Failed to log to DB: {e}")
+        # Queued for a bulk COPY into 'logs'; never waits on Postgres
+        log_writer.write((datetime.utcnow(), level, message, self.name))
@@ -1,9 +1,9 @@
 import asyncio
 import logging
-import json
 import aiohttp
 from agents.base_agent import BaseAgent
 from core.redis_client import redis_client
+from core.tracing import start_trace
 from config.settings import settings
 from datetime import datetime, timedelta
 
@@ -69,11 +69,11 @@ class CalendarAgent(BaseAgent):
 
             if high_impact_events:
                 # Publish to Redis
-                await redis_client.publish("market_status", json.dumps({
+                await redis_client.publish("market_status", start_trace({
                     "type": "news_alert",
                     "events": high_impact_events,
                     "timestamp": now.isoformat()
-                }))
+                }, "fetch"))
                 logger.warning(f"🚨 High Impact News Incoming: {high_impact_events}")
             else:
                 logger.info("📅 No high impact news in next 30 mins.")
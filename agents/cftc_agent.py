@@ -1,10 +1,10 @@
 import asyncio
 import logging
-import json
 import aiohttp
 import re
 from agents.base_agent import BaseAgent
 from core.redis_client import redis_client
+from core.tracing import start_trace
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -79,11 +79,11 @@ class CFTCAgent(BaseAgent):
                 data["JPY"] = jpy_pos
                 
             if data:
-                await redis_client.publish("signals:cftc", json.dumps({
+                await redis_client.publish("signals:cftc", start_trace({
                     "agent_id": self.name,
                     "positions": data,
                     "timestamp": datetime.utcnow().isoformat()
-                }))
+                }, "fetch"))
                 logger.info(f"🏛️ CFTC Data Parsed: {len(data)} currencies")
             else:
                 logger.warning("⚠️ CFTC Parsing Failed (No data found)")
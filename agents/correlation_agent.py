@@ -1,9 +1,9 @@
 import asyncio
 import logging
-import json
 from collections import deque
 from agents.base_agent import BaseAgent
 from core.redis_client import redis_client
+from core.tracing import continue_trace
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -18,41 +18,57 @@ class CorrelationAgent(BaseAgent):
             "USD/JPY": deque(maxlen=60)
         }
         self.last_prices = {}
+        self.last_tick = None # Newest tick used; its trace continues into our signal
+        self.pubsub = None
+        self.task = None
 
-    async def run(self):
-        """Monitor price streams and calculate correlation."""
-        # Subscribe to ticks if not already (handled by main brain usually, but here we need data)
-        # Actually, agents usually pull data or listen. 
-        # For simplicity, we'll listen to the same 'ticks:*' channel or just fetch latest from Redis if available.
-        # Since we don't have a shared state manager yet, we'll subscribe in a background task.
-        
-        if not hasattr(self, 'pubsub'):
-            self.pubsub = await redis_client.subscribe("ticks:*")
-            asyncio.create_task(self.process_ticks())
+    async def start(self):
+        self.pubsub = await redis_client.subscribe("ticks:*", group=self.name)
+        await super().start()
+        self.task = asyncio.create_task(self.process_ticks())
 
+    async def stop(self):
+        await super().stop()
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        if self.pubsub:
+            await self.pubsub.close()
+
+    async def run(self):
+        """Calculate correlation from the latest prices (collected by process_ticks)."""
         # Analyze every 60 seconds
         await self.analyze_correlation()
 
     async def process_ticks(self):
-        """Background task to collect ticks."""
+        """Wait for ticks, then drain everything already pending (only the latest price matters)."""
         while self.running:
             try:
-                message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message['type'] == 'message':
-                    data = json.loads(message['data'])
-                    pair = data.get('s') # Finnhub symbol format
-                    price = data.get('p')
-                    
-                    if pair and price:
-                        # Normalize pair name
-                        if "EUR_USD" in pair: pair = "EUR/USD"
-                        elif "USD_JPY" in pair: pair = "USD/JPY"
-                        
-                        if pair in self.history:
-                            self.last_prices[pair] = price
-            except Exception:
-                pass
-            await asyncio.sleep(0.1)
+                message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                while message is not None:
+                    self.handle(message)
+                    message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ {self.name} Error: {e}")
+                await asyncio.sleep(1)
+
+    def handle(self, message):
+        if message['type'] not in ('message', 'pmessage'):
+            return
+        data = redis_client.decode(message)
+        pair = data.get('symbol') # Finnhub symbol format (OANDA:EUR_USD)
+        price = data.get('price')
+        
+        if pair and price:
+            # Normalize pair name
+            if "EUR_USD" in pair: pair = "EUR/USD"
+            elif "USD_JPY" in pair: pair = "USD/JPY"
+            
+            if pair in self.history:
+                self.last_prices[pair] = price
+                self.last_tick = data
 
     async def analyze_correlation(self):
         """Calculate correlation/divergence."""
@@ -81,7 +97,7 @@ class CorrelationAgent(BaseAgent):
         if (eur_change > 0 and jpy_change > 0) or (eur_change < 0 and jpy_change < 0):
             signal = "WARNING_DIVERGENCE"
             
-        await redis_client.publish("signals:correlation", json.dumps({
+        await redis_client.publish("signals:correlation", continue_trace({
             "agent_id": self.name,
             "signal": signal,
             "details": {
@@ -89,5 +105,5 @@ class CorrelationAgent(BaseAgent):
                 "USDJPY_Change": f"{jpy_change*100:.4f}%"
             },
             "timestamp": datetime.utcnow().isoformat()
-        }))
+        }, self.last_tick, "analysis"))
         logger.info(f"🔗 Correlation: {signal} (EU: {eur_change*100:.2f}%, UJ: {jpy_change*100:.2f}%)")
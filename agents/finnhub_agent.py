@@ -1,70 +1,259 @@
 import asyncio
 import json
+import random
+import time
 import websockets
 import logging
-from collections import deque
 from agents.base_agent import BaseAgent
 from config.settings import settings
 from core.redis_client import redis_client
+from core.tracing import start_trace, mark, now_ms
+from core.tick_store import tick_store
+from core.scheduler import MarketScheduler
 
 logger = logging.getLogger(__name__)
 
+class StaleFeed(Exception):
+    """No trade within FINNHUB_STALE_SECONDS while the market is open."""
+
+class FeedConnection:
+    """One Finnhub WebSocket: its key, symbol shard and live stats."""
+    def __init__(self, index, api_key, symbols):
+        self.index = index
+        self.api_key = api_key
+        self.symbols = symbols
+        self.task = None
+        self.connected = False
+        self.connects = 0
+        self.messages = 0
+        self.trades = 0
+        self.lag_ms = None # now - exchange timestamp of the latest trade
+        self.last_message_at = None # time.monotonic()
+        self.last_trade_at = None # time.monotonic()
+        self.last_trade_ts = None # Exchange ms of the latest trade
+        self.connected_at = None
+        self.failures = 0 # Consecutive failed connections (drives backoff)
+        self.gap = None # Open gap: {"start", "reason"} until the next trade
+        self.gaps = 0
+        self.rate = 0.0 # trades/sec over the last stats window
+        self._window_trades = 0
+        self._window_start = time.monotonic()
+
+    def observe(self, trades):
+        self.messages += 1
+        self.trades += len(trades)
+        self.last_message_at = time.monotonic()
+        if trades:
+            self.lag_ms = now_ms() - trades[-1]['t']
+            self.last_trade_at = self.last_message_at
+            self.last_trade_ts = trades[-1]['t']
+            self.failures = 0
+
+    def open_gap(self, reason):
+        """Feed lost: data after the last trade we saw is missing."""
+        if self.gap is None and self.last_trade_ts is not None:
+            self.gap = {"start": self.last_trade_ts, "reason": reason}
+
+    def close_gap(self, first_ts):
+        """First trade after a gap: returns the finished gap record."""
+        gap, self.gap = self.gap, None
+        self.gaps += 1
+        return {
+            "connection": self.index,
+            "symbols": self.symbols,
+            "start": gap["start"],
+            "end": first_ts,
+            "duration_ms": first_ts - gap["start"],
+            "reason": gap["reason"]
+        }
+
+    def snapshot(self):
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed > 0:
+            self.rate = (self.trades - self._window_trades) / elapsed
+        self._window_trades = self.trades
+        self._window_start = now
+        return {
+            "symbols": len(self.symbols),
+            "connected": self.connected,
+            "connects": self.connects,
+            "gaps": self.gaps,
+            "messages": self.messages,
+            "trades": self.trades,
+            "rate": round(self.rate, 2),
+            "lag_ms": round(self.lag_ms, 1) if self.lag_ms is not None else None,
+            "idle_s": round(now - self.last_message_at, 1) if self.last_message_at else None
+        }
+
+def shard_symbols(symbols, keys, per_connection):
+    """
+    Split symbols over connections: ceil(n / per_connection) shards, but never
+    more shards than keys (one socket per key); symbols are dealt round-robin.
+    """
+    if not keys or not symbols:
+        return []
+    wanted = -(-len(symbols) // max(1, per_connection))
+    count = min(len(keys), wanted)
+    if count < wanted:
+        logger.warning(f"⚠️ {len(symbols)} symbols need {wanted} Finnhub keys, have {len(keys)}; "
+                       f"using ~{-(-len(symbols) // count)} symbols per connection")
+    return [FeedConnection(i, keys[i], symbols[i::count]) for i in range(count)]
+
 class FinnhubWebSocketAgent(BaseAgent):
-    """Agent to stream real-time forex data from Finnhub."""
+    """Agent to stream real-time forex data from Finnhub (one socket per key/shard)."""
     
     def __init__(self, pairs=None):
-        super().__init__(name="finnhub_agent", loop_interval=1)
-        self.pairs = pairs or ["OANDA:EUR_USD", "OANDA:GBP_USD", "OANDA:USD_JPY"]
-        self.api_key = settings.FINNHUB_API_KEYS[0] if settings.FINNHUB_API_KEYS else None
-        self.tick_buffer = deque(maxlen=100)
+        super().__init__(name="finnhub_agent", loop_interval=settings.FINNHUB_STATS_INTERVAL)
+        self.pairs = pairs or settings.FINNHUB_SYMBOLS
+        self.connections = shard_symbols(
+            self.pairs, settings.FINNHUB_API_KEYS, settings.FINNHUB_SYMBOLS_PER_CONNECTION
+        )
+        self.publish_quotes = settings.FINNHUB_PUBLISH_QUOTES
+        self.scheduler = MarketScheduler()
+        self.tick_count = 0
 
-    async def run(self):
-        """Main loop - maintains WebSocket connection."""
-        if not self.api_key:
+    async def start(self):
+        if not self.connections:
             logger.error("❌ No Finnhub API key found!")
-            await asyncio.sleep(5)
+        await super().start()
+        for conn in self.connections:
+            conn.task = asyncio.create_task(self.stream(conn))
+
+    async def stop(self):
+        await super().stop()
+        for conn in self.connections:
+            if conn.task:
+                conn.task.cancel()
+                conn.task = None
+        tick_store.close()
+
+    async def run(self):
+        """Publish per-connection stats (rate, lag) for the dashboard/metrics."""
+        if not self.connections:
             return
+        stats = {f"conn_{c.index}": c.snapshot() for c in self.connections}
+        await redis_client.set("metrics:finnhub", json.dumps(stats))
+
+    async def stream(self, conn):
+        """Keep one shard's WebSocket connected, backing off between failures."""
+        while self.running:
+            await self.connect(conn)
+            if not self.running:
+                break
+            conn.failures += 1
+            # Exponential backoff with full jitter so shards don't reconnect in lockstep
+            delay = min(settings.FINNHUB_RECONNECT_MAX, settings.FINNHUB_RECONNECT_BASE * 2 ** (conn.failures - 1))
+            delay = random.uniform(0, delay)
+            logger.info(f"🔄 Reconnecting Finnhub #{conn.index} in {delay:.1f}s (attempt {conn.failures})")
+            await asyncio.sleep(delay)
 
-        uri = f"wss://ws.finnhub.io?token={self.api_key}"
+    def market_open(self):
+        # Real FX hours, not the session table (which treats Fri/Sun as whole days)
+        return self.scheduler.fx_open()
+
+    async def receive(self, ws, conn):
+        """Next message; raises StaleFeed if trades stop while the market is open."""
+        stale = settings.FINNHUB_STALE_SECONDS
+        while True:
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=stale)
+            except asyncio.TimeoutError:
+                message = None
+            idle = time.monotonic() - (conn.last_trade_at or conn.connected_at)
+            # Pings keep arriving on a dead feed, so only trades count
+            if idle > stale and self.market_open():
+                raise StaleFeed(f"no trades for {idle:.0f}s")
+            if message is not None:
+                return message
+
+    async def connect(self, conn):
+        uri = f"wss://ws.finnhub.io?token={conn.api_key}"
         
         try:
             async with websockets.connect(uri) as ws:
-                await self.log("🔌 Connected to Finnhub WebSocket")
+                conn.connected = True
+                conn.connected_at = time.monotonic()
+                conn.last_trade_at = None
+                conn.connects += 1
+                await self.log(f"🔌 Connected to Finnhub WebSocket #{conn.index} ({len(conn.symbols)} symbols)")
                 
-                # Subscribe to pairs
-                for pair in self.pairs:
+                # Subscribe to this shard's pairs
+                for pair in conn.symbols:
                     await ws.send(json.dumps({'type': 'subscribe', 'symbol': pair}))
-                    logger.info(f"Subscribed to {pair}")
+                    logger.info(f"Subscribed to {pair} on #{conn.index}")
 
                 # Process messages
-                async for message in ws:
-                    if not self.running:
-                        break
-                        
-                    data = json.loads(message)
-                    if data.get('type') == 'trade':
-                        for trade in data['data']:
-                            await self.process_tick(trade)
+                while self.running:
+                    data = json.loads(await self.receive(ws, conn))
+                    if data.get('type') == 'trade' and data.get('data'):
+                        if conn.gap:
+                            await self.report_gap(conn.close_gap(data['data'][0]['t']))
+                        conn.observe(data['data'])
+                        await self.process_frame(data['data'])
                             
+        except asyncio.CancelledError:
+            raise
+        except StaleFeed as e:
+            logger.warning(f"⚠️ Finnhub #{conn.index} stale ({e}), reconnecting")
+            conn.open_gap("stale")
         except Exception as e:
-            logger.error(f"❌ WebSocket Error: {e}")
-            await asyncio.sleep(5)  # Backoff before reconnect
-
-    async def process_tick(self, tick):
-        """Process a single tick."""
-        symbol = tick['s']
-        price = tick['p']
-        timestamp = tick['t']
+            logger.error(f"❌ WebSocket #{conn.index} Error: {e}")
+            conn.open_gap("disconnect")
+        finally:
+            conn.connected = False
+
+    async def report_gap(self, gap):
+        """Publish a closed gap so bar/indicator state over [start, end] can be marked dirty."""
+        await self.log(f"🕳️ Feed gap on #{gap['connection']}: {gap['duration_ms'] / 1000:.1f}s ({gap['reason']})", level="WARNING")
+        await redis_client.publish("feed_gaps", gap)
+
+    async def process_frame(self, trades):
+        """Group one frame's trades per symbol: one message per symbol, not per trade."""
+        by_symbol = {}
+        for trade in trades:
+            group = by_symbol.get(trade['s'])
+            if group is None:
+                by_symbol[trade['s']] = [trade]
+            else:
+                group.append(trade)
+
+        for symbol, group in by_symbol.items():
+            await self.process_ticks(symbol, group)
+
+        # Log occasionally
+        before = self.tick_count
+        self.tick_count += len(trades)
+        if self.tick_count // 500 != before // 500:
+            last = trades[-1]
+            await self.log(f"📉 {last['s']} @ {last['p']} ({self.tick_count} ticks)")
+
+    async def process_ticks(self, symbol, trades):
+        """Process one symbol's trades from a frame (in exchange order)."""
+        last = trades[-1]
+        price = last['p']
+        timestamp = last['t']
         
-        # Publish to Redis for other agents
-        await redis_client.publish(f"ticks:{symbol}", {
+        # Top-level price/timestamp are the latest trade, so quote-only
+        # consumers need not look at the per-trade list
+        payload = {
             "symbol": symbol,
             "price": price,
             "timestamp": timestamp,
+            "trades": [[t['t'], t['p'], t.get('v', 0.0)] for t in trades],
             "source": "finnhub"
-        })
-        
-        # Log occasionally
-        self.tick_buffer.append(price)
-        if len(self.tick_buffer) % 50 == 0:
-            await self.log(f"📉 {symbol} @ {price}")
+        }
+        # Trace starts at the exchange timestamp so feed delay is measured too
+        mark(start_trace(payload, "tick", ts=timestamp)["trace"], "ingest")
+
+        # Local history (buffered append to today's segment file)
+        for ts, p, v in payload["trades"]:
+            tick_store.append(symbol, ts, p, v)
+
+        # Publish to Redis for other agents (pipelined with other symbols)
+        await redis_client.publish_batched(f"ticks:{symbol}", payload)
+        if self.publish_quotes:
+            # Conflated: one latest price per symbol per frame
+            await redis_client.publish_batched(f"quotes:{symbol}", {
+                "symbol": symbol, "price": price, "timestamp": timestamp
+            })
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from agents.base_agent import BaseAgent
+from config.settings import settings
+from core.indicators import IndicatorSet
+from core.redis_client import redis_client
+from core.tracing import continue_trace
+
+logger = logging.getLogger(__name__)
+
+class IndicatorAgent(BaseAgent):
+    """Agent to compute indicators locally from shared bars (replaces polled RSI)."""
+
+    def __init__(self):
+        super().__init__(name="indicator_agent", loop_interval=60)
+        self.timeframes = settings.INDICATOR_TIMEFRAMES
+        self.publish_names = set(settings.INDICATOR_PUBLISH)
+        self.sets = {} # (pair, tf) -> IndicatorSet
+        self.pubsub = None
+        self.task = None
+        self.published = 0
+
+    async def start(self):
+        self.pubsub = await redis_client.subscribe(*[f"bars:{tf}:*" for tf in self.timeframes], group=self.name)
+        await super().start()
+        self.task = asyncio.create_task(self.consume())
+
+    async def stop(self):
+        await super().stop()
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        if self.pubsub:
+            await self.pubsub.close()
+
+    async def run(self):
+        """Periodic heartbeat; the work happens in consume()."""
+        if self.sets:
+            await self.log(f"📈 Tracking {len(self.sets)} pair/timeframe series, {self.published} indicator updates published")
+
+    def rsi_warm(self, pair):
+        """True once RSI is being published for the pair (on any timeframe)."""
+        return any(key[0] == pair and indicators.rsi.value is not None for key, indicators in self.sets.items())
+
+    async def consume(self):
+        """Wait for bar closes, then handle everything already pending."""
+        while self.running:
+            try:
+                message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                while message is not None:
+                    await self.handle(message)
+                    message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ {self.name} Error: {e}")
+                await asyncio.sleep(1)
+
+    async def handle(self, message):
+        if message['type'] not in ('message', 'pmessage'):
+            return
+        bar = redis_client.decode(message)
+        if not isinstance(bar, dict) or bar.get('tf') not in self.timeframes:
+            return
+
+        key = (bar['pair'], bar['tf'])
+        indicators = self.sets.get(key)
+        if indicators is None:
+            indicators = self.sets[key] = IndicatorSet(
+                rsi=settings.INDICATOR_RSI_PERIOD, ema=settings.INDICATOR_EMA_PERIOD
+            )
+        values = indicators.update(bar)
+        if "RSI" not in values:
+            return # Still warming up
+
+        # One message per pair per bar: same shape AlphaVantageAgent published
+        # (RSI as indicator/value), the other indicators ride along as fields
+        payload = {
+            "pair": bar['pair'],
+            "indicator": "RSI",
+            "value": values["RSI"]['value'],
+            "timestamp": bar['end'],
+            "timeframe": bar['tf'],
+            "dirty": indicators.dirty > 0,
+            "indicators": {name: fields for name, fields in values.items() if name != "RSI" and name in self.publish_names}
+        }
+        await redis_client.publish(f"technical:{bar['pair']}", continue_trace(payload, bar, "indicator"))
+        self.published += 1
@@ -1,9 +1,9 @@
 import asyncio
 import logging
-import json
 from datetime import datetime
 from agents.visual_base_agent import VisualBaseAgent
 from core.redis_client import redis_client
+from core.tracing import start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -35,9 +35,9 @@ class NewsAgent(VisualBaseAgent):
         analysis = await self.capture_and_analyze(self.url, prompt)
         
         if analysis:
-            await redis_client.publish("signals:news", json.dumps({
+            await redis_client.publish("signals:news", start_trace({
                 "agent_id": self.name,
                 "data": analysis,
                 "timestamp": datetime.utcnow().isoformat()
-            }))
+            }, "analysis"))
             logger.info(f"📰 News Analysis Published: {analysis.get('overall_sentiment')}")
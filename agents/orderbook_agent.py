@@ -1,9 +1,9 @@
 import asyncio
 import logging
-import json
 from playwright.async_api import async_playwright
 from agents.base_agent import BaseAgent
 from core.redis_client import redis_client
+from core.tracing import start_trace
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -71,11 +71,11 @@ class OrderBookAgent(BaseAgent):
                         })
             
             if signals:
-                await redis_client.publish("signals:orderbook", json.dumps({
+                await redis_client.publish("signals:orderbook", start_trace({
                     "agent_id": self.name,
                     "signals": signals,
                     "timestamp": datetime.utcnow().isoformat()
-                }))
+                }, "fetch"))
                 logger.info(f"📖 Order Book Signals: {len(signals)} pairs analyzed")
                 
         except Exception as e:
@@ -27,3 +27,4 @@ class DynamicRiskAgent(BaseAgent):
         
         lot_size = risk_amount / (stop_loss_pips * pip_value)
         return round(lot_size, 2)
+
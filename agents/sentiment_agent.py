@@ -4,6 +4,7 @@ import logging
 from agents.base_agent import BaseAgent
 from core.llm import groq_rotator
 from core.redis_client import redis_client
+from core.tracing import start_trace
 from playwright.async_api import async_playwright
 
 logger = logging.getLogger(__name__)
@@ -70,12 +71,12 @@ class SentimentAgent(BaseAgent):
             await self.log(f"📰 Sentiment: {analysis['sentiment']} ({analysis['impact']})")
             
             # Publish signal
-            await redis_client.publish("signals:sentiment:global", {
+            await redis_client.publish("signals:sentiment:global", start_trace({
                 "agent": self.name,
                 "sentiment": analysis['sentiment'],
                 "impact": analysis['impact'],
                 "headline": headline
-            })
+            }, "analysis"))
             
         except Exception as e:
             logger.error(f"❌ Sentiment Error: {e}")
@@ -1,10 +1,10 @@
 import asyncio
 import logging
 import pytz
-import json
 from datetime import datetime
 from agents.base_agent import BaseAgent
 from core.redis_client import redis_client
+from core.tracing import start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,7 @@ class SessionAgent(BaseAgent):
             "is_news_event": is_news_event
         }
         
-        await redis_client.publish("market_status", json.dumps(status))
+        await redis_client.publish("market_status", start_trace(status, "fetch"))
         logger.info(f"🌍 Market Status: {active_sessions} | Liquidity: {liquidity}")
 
     def get_liquidity_status(self, pair):
@@ -0,0 +1,67 @@
+import json
+import logging
+from datetime import datetime
+from agents.base_agent import BaseAgent
+from core.brain import Signal
+from core.bulk_writer import BulkWriter
+from core.redis_client import redis_client
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+class SignalRecorderAgent(BaseAgent):
+    """Agent to persist every signal on the bus to the 'signals' table."""
+    
+    def __init__(self):
+        super().__init__(name="signal_recorder", loop_interval=0)
+        self.pubsub = None
+        self.writer = BulkWriter(
+            "signals", ["timestamp", "pair", "agent_id", "signal", "confidence", "data"],
+            max_batch=settings.SIGNAL_BATCH_SIZE,
+            flush_interval=settings.SIGNAL_FLUSH_INTERVAL,
+            max_buffer=settings.SIGNAL_BUFFER_MAX
+        )
+
+    async def start(self):
+        # Own subscription: recording never sits on the brain's voting path
+        self.pubsub = await redis_client.subscribe("signals:*", group=self.name)
+        await super().start()
+        self.writer.start()
+
+    async def stop(self):
+        await super().stop()
+        if self.pubsub:
+            await self.pubsub.close()
+        await self.writer.stop()
+
+    async def run(self):
+        """Wait for signals, then queue everything already pending."""
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        while message is not None:
+            self.record(message)
+            message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+
+    def record(self, message):
+        """Normalize one bus message into a signals row."""
+        if message['type'] not in ('message', 'pmessage'):
+            return
+        try:
+            data = redis_client.decode(message)
+        except ValueError as e:
+            logger.warning(f"⚠️ Signal Recorder skipped malformed payload on {message['channel']}: {e}")
+            return
+        if not isinstance(data, dict):
+            return
+
+        signal = Signal.from_message(data, 0.0)
+        self.writer.write((
+            datetime.utcnow(),
+            signal.pair[:20] if signal.pair else None, # Column widths: a bad value would fail the whole COPY
+            signal.agent[:50],
+            signal.direction.name,
+            signal.confidence,
+            json.dumps(data, default=str)
+        ))
+
+    def get_metrics(self):
+        return self.writer.get_metrics()
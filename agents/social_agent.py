@@ -5,6 +5,7 @@ import asyncpraw
 from agents.base_agent import BaseAgent
 from core.llm import groq_rotator
 from core.redis_client import redis_client
+from core.tracing import start_trace
 from config.settings import settings
 from datetime import datetime
 
@@ -74,11 +75,11 @@ class SocialAgent(BaseAgent):
             response = await groq_rotator.chat_completion(prompt)
             sentiment_data = json.loads(response)
             
-            await redis_client.publish("signals:social", json.dumps({
+            await redis_client.publish("signals:social", start_trace({
                 "agent_id": self.name,
                 "sentiment": sentiment_data,
                 "timestamp": datetime.utcnow().isoformat()
-            }))
+            }, "analysis"))
             logger.info(f"🗣️ Social Sentiment: {sentiment_data}")
             
         except Exception as e:
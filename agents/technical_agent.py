@@ -3,6 +3,7 @@ import logging
 from agents.base_agent import BaseAgent
 from core.llm import groq_rotator
 from core.redis_client import redis_client
+from core.tracing import continue_trace
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,8 @@ class TechnicalAnalysisAgent(BaseAgent):
             return
 
         message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-        if message and message['type'] == 'message':
-            data = json.loads(message['data'])
+        if message and message['type'] in ('message', 'pmessage'):
+            data = redis_client.decode(message)
             await self.analyze(data)
 
     async def analyze(self, data):
@@ -33,12 +34,14 @@ class TechnicalAnalysisAgent(BaseAgent):
         pair = data['pair']
         indicator = data['indicator']
         value = data['value']
+        # Local indicator_agent messages carry the rest of the bar's indicators
+        others = "".join(f"\n        The {name} for {pair} is {fields}." for name, fields in data.get('indicators', {}).items())
         
         prompt = f"""
         You are a forex expert. 
-        The {indicator} for {pair} is {value}.
+        The {indicator} for {pair} is {value}.{others}
         
-        Analyze this single data point.
+        Analyze this data.
         Return JSON only:
         {{
             "signal": "BUY|SELL|NEUTRAL",
@@ -56,13 +59,13 @@ class TechnicalAnalysisAgent(BaseAgent):
             await self.log(f"🧠 Analysis for {pair}: {analysis['signal']} ({analysis['reasoning']})")
             
             # Publish signal
-            await redis_client.publish(f"signals:technical:{pair}", {
+            await redis_client.publish(f"signals:technical:{pair}", continue_trace({
                 "agent": self.name,
                 "pair": pair,
                 "signal": analysis['signal'],
                 "confidence": analysis['confidence'],
                 "reasoning": analysis['reasoning']
-            })
+            }, data, "analysis"))
             
         except Exception as e:
             logger.error(f"❌ Analysis Error: {e}")
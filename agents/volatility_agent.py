@@ -1,8 +1,8 @@
 import asyncio
 import logging
-import json
 from agents.base_agent import BaseAgent
 from core.redis_client import redis_client
+from core.tracing import start_trace
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -26,10 +26,10 @@ class VolatilityAgent(BaseAgent):
         elif atr_value > threshold_high:
             state = "BREAKOUT_WATCH"
             
-        await redis_client.publish("signals:volatility", json.dumps({
+        await redis_client.publish("signals:volatility", start_trace({
             "agent_id": self.name,
             "state": state,
             "atr": atr_value,
             "timestamp": datetime.utcnow().isoformat()
-        }))
+        }, "analysis"))
         logger.info(f"zz Volatility State: {state} (ATR: {atr_value})")
@@ -17,6 +17,26 @@ class Settings:
         if os.getenv(f"FINNHUB_API_KEY_{i}")
     ]
     
+    # Finnhub symbol universe (all 28 majors/crosses), sharded across keys
+    FINNHUB_SYMBOLS = [
+        s.strip() for s in (os.getenv("FINNHUB_SYMBOLS") or ",".join([
+            "OANDA:EUR_USD", "OANDA:GBP_USD", "OANDA:USD_JPY", "OANDA:USD_CHF",
+            "OANDA:AUD_USD", "OANDA:USD_CAD", "OANDA:NZD_USD",
+            "OANDA:EUR_GBP", "OANDA:EUR_JPY", "OANDA:EUR_CHF", "OANDA:EUR_AUD",
+            "OANDA:EUR_CAD", "OANDA:EUR_NZD", "OANDA:GBP_JPY", "OANDA:GBP_CHF",
+            "OANDA:GBP_AUD", "OANDA:GBP_CAD", "OANDA:GBP_NZD", "OANDA:AUD_JPY",
+            "OANDA:AUD_CHF", "OANDA:AUD_CAD", "OANDA:AUD_NZD", "OANDA:NZD_JPY",
+            "OANDA:NZD_CHF", "OANDA:NZD_CAD", "OANDA:CAD_JPY", "OANDA:CAD_CHF",
+            "OANDA:CHF_JPY"
+        ])).split(",") if s.strip()
+    ]
+    FINNHUB_SYMBOLS_PER_CONNECTION = int(os.getenv("FINNHUB_SYMBOLS_PER_CONNECTION", 10))
+    FINNHUB_PUBLISH_QUOTES = os.getenv("FINNHUB_PUBLISH_QUOTES", "false").lower() == "true" # Also emit conflated quotes:{symbol}
+    FINNHUB_RECONNECT_BASE = float(os.getenv("FINNHUB_RECONNECT_BASE", 1)) # Seconds, doubled per failed attempt
+    FINNHUB_RECONNECT_MAX = float(os.getenv("FINNHUB_RECONNECT_MAX", 60))
+    FINNHUB_STALE_SECONDS = float(os.getenv("FINNHUB_STALE_SECONDS", 30)) # No trade for this long in an open session = reconnect
+    FINNHUB_STATS_INTERVAL = int(os.getenv("FINNHUB_STATS_INTERVAL", 10)) # Seconds between per-connection stats
+    
     # Alpha Vantage
     ALPHA_VANTAGE_KEYS = [
         os.getenv(f"ALPHA_VANTAGE_KEY_{i}") for i in range(1, 51) 
@@ -29,10 +49,94 @@ class Settings:
     DB_NAME = os.getenv("DB_NAME", "jarvis_trader")
     DB_USER = os.getenv("DB_USER", "postgres")
     DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
+    DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", 2))
+    DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", 10))
+    DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", 10)) # Seconds per query
+    DB_MAX_INACTIVE_LIFETIME = float(os.getenv("DB_MAX_INACTIVE_LIFETIME", 300)) # Idle connections closed after (s)
+    DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100)) # Prepared statements kept per connection
+    
+    # Agent log writer (buffered COPY into 'logs')
+    LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", 500)) # Rows per COPY
+    LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", 1.0)) # Seconds
+    LOG_BUFFER_MAX = int(os.getenv("LOG_BUFFER_MAX", 50000)) # Rows held while Postgres is slow/down
+    LOG_OVERFLOW = os.getenv("LOG_OVERFLOW", "drop_oldest") # or "drop_newest"
+    
+    # Dashboard log stream (run.py RedisLogHandler)
+    LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000)) # Records buffered before dropping
+    LOG_RATE_PER_LOGGER = float(os.getenv("LOG_RATE_PER_LOGGER", 50)) # Records/sec per logger (0 = unlimited)
+    LOG_RATE_BURST = int(os.getenv("LOG_RATE_BURST", 200))
+    LOG_PUBLISH_BATCH = int(os.getenv("LOG_PUBLISH_BATCH", 200)) # Records per pipeline
+    
+    # Bars built from ticks (published on bars:{tf}:{symbol} at each close)
+    BAR_TIMEFRAMES = [tf.strip() for tf in os.getenv("BAR_TIMEFRAMES", "1s,1m,5m,15m,1h").split(",") if tf.strip()]
+    BAR_HISTORY = int(os.getenv("BAR_HISTORY", 500)) # Closed bars kept per symbol/timeframe
+    BAR_CLOSE_GRACE_MS = int(os.getenv("BAR_CLOSE_GRACE_MS", 250)) # Margin on top of the observed feed lag before closing on the clock
+    
+    # Local indicators (computed from bars, one technical:{pair} message per bar close;
+    # INDICATOR_PUBLISH picks which indicators ride along with RSI)
+    INDICATOR_TIMEFRAMES = [tf.strip() for tf in os.getenv("INDICATOR_TIMEFRAMES", "15m").split(",") if tf.strip()]
+    INDICATOR_PUBLISH = [name.strip() for name in os.getenv("INDICATOR_PUBLISH", "RSI,EMA,ATR,BBANDS,MACD").split(",") if name.strip()]
+    INDICATOR_RSI_PERIOD = int(os.getenv("INDICATOR_RSI_PERIOD", 14))
+    INDICATOR_EMA_PERIOD = int(os.getenv("INDICATOR_EMA_PERIOD", 20))
+    
+    # Local tick history (append-only binary segments, one file per symbol per day)
+    TICK_STORE_DIR = os.getenv("TICK_STORE_DIR", "data/ticks")
+    TICK_STORE_MAX_MAPS = int(os.getenv("TICK_STORE_MAX_MAPS", 64)) # Past-day segments kept memory-mapped
+    
+    # Partitioning / retention ("daily" or "weekly" ranges on timestamp; retention 0 = keep forever)
+    LOG_PARTITION_INTERVAL = os.getenv("LOG_PARTITION_INTERVAL", "daily")
+    SIGNAL_PARTITION_INTERVAL = os.getenv("SIGNAL_PARTITION_INTERVAL", "daily")
+    TRADE_PARTITION_INTERVAL = os.getenv("TRADE_PARTITION_INTERVAL", "weekly")
+    LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", 14))
+    SIGNAL_RETENTION_DAYS = int(os.getenv("SIGNAL_RETENTION_DAYS", 180))
+    TRADE_RETENTION_DAYS = int(os.getenv("TRADE_RETENTION_DAYS", 0))
+    DB_PARTITIONS_AHEAD = int(os.getenv("DB_PARTITIONS_AHEAD", 3)) # Future partitions kept ready
+    DB_MAINTENANCE_INTERVAL = int(os.getenv("DB_MAINTENANCE_INTERVAL", 3600)) # Seconds
+    
+    # Signal recorder (buffered COPY into 'signals')
+    SIGNAL_BATCH_SIZE = int(os.getenv("SIGNAL_BATCH_SIZE", 1000)) # Rows per COPY
+    SIGNAL_FLUSH_INTERVAL = float(os.getenv("SIGNAL_FLUSH_INTERVAL", 1.0)) # Seconds
+    SIGNAL_BUFFER_MAX = int(os.getenv("SIGNAL_BUFFER_MAX", 200000)) # Rows held while Postgres is slow/down
     
     # Redis
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 32)) # Includes one per subscription
+    REDIS_PUBLISH_BATCH = int(os.getenv("REDIS_PUBLISH_BATCH", 256)) # Messages per pipeline flush
+    REDIS_PUBLISH_LINGER_US = int(os.getenv("REDIS_PUBLISH_LINGER_US", 500)) # Max wait to fill a batch
+    REDIS_PUBLISH_MAX_PENDING = int(os.getenv("REDIS_PUBLISH_MAX_PENDING", 10000)) # Backpressure limit
+    # Bus transport: "pubsub" (fire and forget), "streams" (consumer groups, replayable)
+    # or "inprocess" (agents in one process exchange Python objects; Redis is only a bridge)
+    BUS_TRANSPORT = os.getenv("BUS_TRANSPORT", "pubsub")
+    BUS_BRIDGE_PATTERNS = os.getenv("BUS_BRIDGE_PATTERNS", "signals:*,brain_status,market_status").split(",") # inprocess -> Redis
+    BUS_QUEUE_SIZE = int(os.getenv("BUS_QUEUE_SIZE", 10000)) # Per in-process subscriber, oldest dropped when full
+    STREAM_FAMILIES = os.getenv("STREAM_FAMILIES", "ticks,signals").split(",") # Channel prefixes backed by streams
+    STREAM_MAXLEN = int(os.getenv("STREAM_MAXLEN", 100000)) # Approximate cap per stream
+    STREAM_BATCH = int(os.getenv("STREAM_BATCH", 256)) # Entries per XREADGROUP
+    STREAM_BLOCK_MS = int(os.getenv("STREAM_BLOCK_MS", 100)) # Max block while also serving pub/sub channels
+    STREAM_CONSUMER_NAME = os.getenv("STREAM_CONSUMER_NAME") # Name prefix (default: group); hostname and pid are appended
+    STREAM_CLAIM_IDLE_MS = int(os.getenv("STREAM_CLAIM_IDLE_MS", 60000)) # Pending this long = owner presumed dead, XAUTOCLAIM it
+    STREAM_CLAIM_INTERVAL = int(os.getenv("STREAM_CLAIM_INTERVAL", 30)) # Seconds between stale-entry sweeps
+    STREAM_PUBSUB_MIRROR = os.getenv("STREAM_PUBSUB_MIRROR", "signals:*").split(",") # Also PUBLISH these (dashboard)
+    # Wire format per channel pattern, "pattern=codec" comma separated (json|msgpack).
+    # Channels the dashboard reads (signals:*, brain_status, market_status, logs) must stay JSON.
+    REDIS_CHANNEL_CODECS = [
+        tuple(rule.strip().split("=", 1)) for rule in
+        os.getenv("REDIS_CHANNEL_CODECS", "ticks:*=msgpack,quotes:*=msgpack").split(",")
+        if "=" in rule
+    ]
+
+    # Agents (comma separated names, e.g. "finnhub_agent,risk_agent"; empty = all)
+    ENABLED_AGENTS = [
+        name.strip() for name in os.getenv("ENABLED_AGENTS", "").split(",")
+        if name.strip()
+    ] or None
+    AGENT_START_TIMEOUT = float(os.getenv("AGENT_START_TIMEOUT", 30)) # Seconds, per agent
+
+    # Brain
+    BRAIN_COALESCE_MS = float(os.getenv("BRAIN_COALESCE_MS", 10)) # Quiet period that ends a burst
+    BRAIN_COALESCE_MAX_MS = float(os.getenv("BRAIN_COALESCE_MAX_MS", 50)) # Hard cap on added latency
+    METRICS_INTERVAL = float(os.getenv("METRICS_INTERVAL", 10)) # Seconds between 'metrics:brain' updates
 
     # Exness
     EXNESS_EMAIL = os.getenv("EXNESS_EMAIL")
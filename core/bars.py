@@ -0,0 +1,187 @@
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Timeframe name -> bar length in milliseconds
+TIMEFRAMES = {"1s": 1000, "1m": 60000, "5m": 300000, "15m": 900000, "1h": 3600000}
+
+BAR_DTYPE = np.dtype([
+    ("start", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"),
+    ("close", "<f8"), ("volume", "<f8"), ("ticks", "<i4"), ("dirty", "?")
+])
+
+class BarSeries:
+    """
+    OHLCV bars for one symbol/timeframe. The bar being built lives in plain
+    attributes (cheap per tick); closed bars go into a fixed-size ring array.
+    """
+    def __init__(self, length_ms, capacity=500):
+        self.length_ms = length_ms
+        self.ring = np.zeros(capacity, dtype=BAR_DTYPE)
+        self.head = 0 # Next slot to write
+        self.count = 0 # Closed bars held (<= capacity)
+        self.start = None # Open bar, None until the first tick
+        self.last_closed = None # Start of the newest closed bar; ticks at or before it are late
+        self.late = 0
+        self.open = self.high = self.low = self.close = 0.0
+        self.volume = 0.0
+        self.ticks = 0
+        self.dirty = False
+        self.trace = None # Trace of the newest tick in the open bar
+
+    def update(self, ts_ms, price, volume=0.0, trace=None):
+        """Add a tick; returns the bar it closed (a dict) or None."""
+        start = ts_ms - ts_ms % self.length_ms
+        if (self.last_closed is not None and start <= self.last_closed) or \
+                (self.start is not None and start < self.start):
+            # Its bar is already closed/published (or was never opened): drop it
+            # rather than re-open that bar and publish it twice
+            self.late += 1
+            return None
+
+        closed = None
+        if self.start is None or start > self.start:
+            if self.start is not None:
+                closed = self._close()
+            self.start = start
+            self.open = self.high = self.low = self.close = price
+            self.volume = volume
+            self.ticks = 1
+            self.trace = trace
+            return closed
+
+        # Same bar
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.ticks += 1
+        if trace is not None:
+            self.trace = trace
+        return None
+
+    def flush(self, exchange_now_ms):
+        """Close the open bar if its period has ended by `exchange_now_ms` (exchange time)."""
+        if self.start is not None and exchange_now_ms >= self.start + self.length_ms:
+            return self._close()
+        return None
+
+    def _close(self):
+        slot = self.ring[self.head]
+        slot["start"] = self.start
+        slot["open"] = self.open
+        slot["high"] = self.high
+        slot["low"] = self.low
+        slot["close"] = self.close
+        slot["volume"] = self.volume
+        slot["ticks"] = self.ticks
+        slot["dirty"] = self.dirty
+        self.head = (self.head + 1) % len(self.ring)
+        self.count = min(self.count + 1, len(self.ring))
+        self.last_closed = self.start
+
+        bar = {
+            "start": self.start,
+            "end": self.start + self.length_ms,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "ticks": self.ticks,
+            "dirty": self.dirty,
+            "trace": self.trace
+        }
+        self.start = None
+        self.dirty = False
+        self.trace = None
+        return bar
+
+    def mark_dirty(self, start_ms, end_ms):
+        """Flag bars overlapping a feed gap [start_ms, end_ms]; returns how many."""
+        held = self.last(self.count) if self.count else self.ring[:0]
+        overlap = (held["start"] + self.length_ms > start_ms) & (held["start"] <= end_ms)
+        marked = int(overlap.sum())
+        if marked:
+            # last() returns a copy; map the hits back onto ring slots
+            first = (self.head - self.count) % len(self.ring)
+            for i in np.nonzero(overlap)[0]:
+                self.ring[(first + i) % len(self.ring)]["dirty"] = True
+        if self.start is not None and self.start <= end_ms:
+            self.dirty = True
+            marked += 1
+        return marked
+
+    def last(self, n):
+        """Up to `n` most recent closed bars, oldest first (a copy)."""
+        n = min(n, self.count)
+        if n <= 0:
+            return self.ring[:0].copy()
+        idx = (self.head - n + np.arange(n)) % len(self.ring)
+        return self.ring[idx]
+
+class BarAggregator:
+    """
+    Builds bars for every symbol across TIMEFRAMES from a tick stream.
+    Bars also close on a timer (flush); that works in exchange time, i.e.
+    local time minus the feed lag observed per symbol, plus a small grace.
+    """
+    def __init__(self, timeframes=None, capacity=500, grace_ms=250):
+        self.timeframes = {tf: TIMEFRAMES[tf] for tf in (timeframes or TIMEFRAMES)}
+        self.capacity = capacity
+        self.grace_ms = grace_ms
+        self.series = {} # symbol -> {tf: BarSeries}
+        self.lag = {} # symbol -> feed lag estimate (ms): jumps up to peaks, decays slowly
+
+    def observe_lag(self, symbol, lag_ms):
+        """Record arrival time minus exchange timestamp for a symbol's newest tick."""
+        current = self.lag.get(symbol)
+        if current is None or lag_ms > current:
+            self.lag[symbol] = lag_ms
+        else:
+            self.lag[symbol] = current + (lag_ms - current) * 0.05
+
+    def _series(self, symbol):
+        series = self.series.get(symbol)
+        if series is None:
+            series = self.series[symbol] = {
+                tf: BarSeries(length, self.capacity) for tf, length in self.timeframes.items()
+            }
+        return series
+
+    def on_tick(self, symbol, ts_ms, price, volume=0.0, trace=None):
+        """Feed one tick; returns [(tf, bar), ...] for bars it closed."""
+        closed = []
+        for tf, series in self._series(symbol).items():
+            bar = series.update(ts_ms, price, volume, trace)
+            if bar:
+                closed.append((tf, bar))
+        return closed
+
+    def flush(self, now_ms):
+        """Close bars whose period has ended by local time `now_ms`: [(symbol, tf, bar), ...]."""
+        closed = []
+        for symbol, by_tf in self.series.items():
+            exchange_now = now_ms - max(self.lag.get(symbol, 0.0), 0.0) - self.grace_ms
+            for tf, series in by_tf.items():
+                bar = series.flush(exchange_now)
+                if bar:
+                    closed.append((symbol, tf, bar))
+        return closed
+
+    def mark_gap(self, symbols, start_ms, end_ms):
+        marked = 0
+        for symbol in symbols:
+            for series in self.series.get(symbol, {}).values():
+                marked += series.mark_dirty(start_ms, end_ms)
+        return marked
+
+    def late_ticks(self):
+        return sum(series.late for by_tf in self.series.values() for series in by_tf.values())
+
+    def bars(self, symbol, tf, n):
+        series = self.series.get(symbol, {}).get(tf)
+        return series.last(n) if series else np.empty(0, dtype=BAR_DTYPE)
@@ -1,95 +1,219 @@
 import asyncio
+import enum
 import logging
 import json
+import sys
+import time
 from collections import deque, defaultdict
-from datetime import datetime, timedelta
 from core.scheduler import MarketScheduler
 from core.database import db
-from core.redis_client import redis_client
+from core.bulk_writer import log_writer
+from core.redis_client import redis_client, decode_payload
+from core.market_state import MarketState
+from core.registry import AgentRegistry
+from core.tracing import tracer, mark
 from config.settings import settings
 
-# Agents
-from agents.finnhub_agent import FinnhubWebSocketAgent
-from agents.alpha_vantage_agent import AlphaVantageAgent
-from agents.vision_agent import InvestingChartVisionAgent
-from agents.technical_agent import TechnicalAnalysisAgent
-from agents.sentiment_agent import SentimentAgent
-from agents.execution_agent import ExnessExecutionAgent
-from agents.risk_agent import DynamicRiskAgent
-from agents.session_agent import SessionAgent
-from agents.news_agent import NewsAgent
-from agents.social_agent import SocialAgent
-from agents.correlation_agent import CorrelationAgent
-from agents.volatility_agent import VolatilityAgent
-
 logger = logging.getLogger(__name__)
 
+class Direction(enum.Enum):
+    NEUTRAL = 0
+    BUY = 1
+    SELL = 2
+
+_direction_cache = {} # {raw agent string: Direction}
+_DIRECTION_CACHE_MAX = 1024
+
+def parse_direction(raw):
+    """Map an agent's raw signal/sentiment/state string to a Direction."""
+    if not isinstance(raw, str):
+        return Direction.NEUTRAL
+    direction = _direction_cache.get(raw)
+    if direction is not None:
+        return direction
+
+    upper = raw.upper()
+    if "BUY" in upper or "BULLISH" in upper:
+        direction = Direction.BUY
+    elif "SELL" in upper or "BEARISH" in upper:
+        direction = Direction.SELL
+    else:
+        direction = Direction.NEUTRAL
+
+    # Agents repeat a small vocabulary, so caching skips the string work
+    if len(_direction_cache) < _DIRECTION_CACHE_MAX:
+        _direction_cache[raw] = direction
+    return direction
+
+class Signal:
+    """A bus message normalized once at ingest; later stages read only this."""
+    __slots__ = ("agent", "pair", "direction", "confidence", "received_at", "trace")
+
+    def __init__(self, agent, pair, direction, confidence, received_at, trace=None):
+        self.agent = agent
+        self.pair = pair
+        self.direction = direction
+        self.confidence = confidence
+        self.received_at = received_at
+        self.trace = trace
+
+    @classmethod
+    def from_message(cls, data, received_at):
+        """Build a Signal from a raw agent payload (any of the agent key styles)."""
+        agent = data.get('agent') or data.get('agent_id') or 'unknown_agent'
+        pair = data.get('pair') or data.get('symbol')
+        raw_direction = data.get('signal') or data.get('sentiment') or data.get('state')
+        try:
+            confidence = float(data.get('confidence', 0.5))
+        except (TypeError, ValueError):
+            confidence = 0.5
+        trace = data.get('trace')
+        if trace:
+            # Own copy: with the in-process bus the payload is shared with other subscribers
+            trace = {"id": trace["id"], "stages": list(trace["stages"])}
+        return cls(
+            sys.intern(str(agent)),
+            sys.intern(pair) if isinstance(pair, str) else None,
+            parse_direction(raw_direction),
+            confidence,
+            received_at,
+            trace
+        )
+
+    def __repr__(self):
+        return f"Signal({self.agent}, {self.pair}, {self.direction.name}, {self.confidence:.2f})"
+
+class PairWindow:
+    """Time-ordered votes for one pair with running totals.
+
+    Entries are appended at the back and expire from the front, so both
+    insert and eviction adjust the totals in O(1).
+    """
+    __slots__ = ("entries", "buy_votes", "sell_votes", "total_confidence", "agents")
+
+    def __init__(self):
+        self.entries = deque() # Signal records, oldest first
+        self.buy_votes = 0
+        self.sell_votes = 0
+        self.total_confidence = 0.0
+        self.agents = {} # {agent: [buy_confidence, sell_confidence, votes]}
+
+    def push(self, signal):
+        self.entries.append(signal)
+        totals = self.agents.get(signal.agent)
+        if totals is None:
+            totals = self.agents[signal.agent] = [0.0, 0.0, 0]
+        if signal.direction is Direction.BUY:
+            self.buy_votes += 1
+            totals[0] += signal.confidence
+        else:
+            self.sell_votes += 1
+            totals[1] += signal.confidence
+        totals[2] += 1
+        self.total_confidence += signal.confidence
+
+    def expire(self, cutoff):
+        entries = self.entries
+        while entries and entries[0].received_at <= cutoff:
+            signal = entries.popleft()
+            totals = self.agents[signal.agent]
+            if signal.direction is Direction.BUY:
+                self.buy_votes -= 1
+                totals[0] -= signal.confidence
+            else:
+                self.sell_votes -= 1
+                totals[1] -= signal.confidence
+            totals[2] -= 1
+            if totals[2] == 0:
+                del self.agents[signal.agent]
+            self.total_confidence -= signal.confidence
+        if not entries:
+            # Reset to exact zero so float subtraction can't drift
+            self.total_confidence = 0.0
+
 class SignalBuffer:
-    """Stores signals in a rolling window."""
-    def __init__(self, window_seconds=10):
+    """Stores directional votes per pair in a rolling time window."""
+    def __init__(self, window_seconds=10, clock=time.monotonic):
         self.window_seconds = window_seconds
-        self.buffer = defaultdict(list) # {pair: [{signal_data}, ...]}
+        self.clock = clock
+        self.buffer = defaultdict(PairWindow) # {pair: PairWindow}
+
+    def add(self, signal):
+        """Add a normalized Signal; neutral signals only advance the window."""
+        window = self.buffer[signal.pair]
+        window.expire(signal.received_at - self.window_seconds)
+        if signal.direction is not Direction.NEUTRAL:
+            window.push(signal)
 
-    def add_signal(self, pair, data):
-        now = datetime.utcnow()
-        data['received_at'] = now
-        self.buffer[pair].append(data)
-        self.cleanup(pair, now)
+    def cleanup(self, pair, now=None):
+        """Evict votes older than the window for a pair."""
+        if pair in self.buffer:
+            if now is None:
+                now = self.clock()
+            self.buffer[pair].expire(now - self.window_seconds)
 
-    def cleanup(self, pair, now):
-        cutoff = now - timedelta(seconds=self.window_seconds)
-        self.buffer[pair] = [s for s in self.buffer[pair] if s['received_at'] > cutoff]
+    def clear(self, pair):
+        self.buffer.pop(pair, None)
 
     def get_votes(self, pair):
-        buy_votes = 0
-        sell_votes = 0
-        total_confidence = 0
-        count = 0
-        
-        for s in self.buffer[pair]:
-            sig = s.get('signal') or s.get('sentiment') # Handle different keys
-            conf = s.get('confidence', 0.5)
-            
-            # Normalize signals
-            if isinstance(sig, str):
-                if "BUY" in sig.upper() or "BULLISH" in sig.upper():
-                    buy_votes += 1
-                    total_confidence += conf
-                    count += 1
-                elif "SELL" in sig.upper() or "BEARISH" in sig.upper():
-                    sell_votes += 1
-                    total_confidence += conf
-                    count += 1
-                    
-        avg_conf = (total_confidence / count) if count > 0 else 0
-        return buy_votes, sell_votes, avg_conf, count
+        """Returns (buy_votes, sell_votes, avg_confidence, count) in O(1)."""
+        if pair not in self.buffer:
+            return 0, 0, 0, 0
+        self.cleanup(pair)
+        window = self.buffer[pair]
+        count = window.buy_votes + window.sell_votes
+        avg_conf = (window.total_confidence / count) if count > 0 else 0
+        return window.buy_votes, window.sell_votes, avg_conf, count
+
+    def latest(self, pair):
+        """Newest live vote for a pair, or None."""
+        window = self.buffer.get(pair)
+        return window.entries[-1] if window and window.entries else None
+
+    def get_agent_totals(self, pair):
+        """Returns {agent: [buy_confidence, sell_confidence, votes]} for live votes."""
+        if pair not in self.buffer:
+            return {}
+        self.cleanup(pair)
+        return self.buffer[pair].agents
 
 class MainBrain:
     """Central orchestrator with advanced voting logic."""
     
-    def __init__(self):
+    def __init__(self, enabled_agents=None, bus=None, clock=time.monotonic):
         self.scheduler = MarketScheduler()
         self.running = False
-        self.signal_buffer = SignalBuffer(window_seconds=10)
+        self.bus = bus or redis_client # Anything with async publish/subscribe
+        self.pubsub = None
+        self.signal_buffer = SignalBuffer(window_seconds=10, clock=clock)
+        self.market_state = MarketState(clock=self.signal_buffer.clock)
+        self.max_batch_size = 500 # Max messages drained per wakeup before voting
+        self.agent_weights = {} # {agent_name: weight}, tuned by update_learning
+        self.pair_queues = {} # {pair: asyncio.Queue(maxsize=1)} pending evaluations
+        self.pair_workers = {} # {pair: asyncio.Task}
+        self.superseded_evaluations = 0
+        self.coalesced_evaluations = 0
+        self.stale_decisions = 0 # Decisions dropped on re-check after waiting for execution_lock
+        self.coalesce_window = settings.BRAIN_COALESCE_MS / 1000 # Debounce per pair (0 disables)
+        self.coalesce_max_delay = max(settings.BRAIN_COALESCE_MAX_MS / 1000, self.coalesce_window)
+        # Voting runs per pair in parallel, but the execution agent drives one
+        # shared browser page: risk + order placement go through one at a time
+        self.execution_lock = asyncio.Lock()
         
-        # Initialize Agents
-        self.agents = [
-            FinnhubWebSocketAgent(),
-            AlphaVantageAgent(),
-            InvestingChartVisionAgent(),
-            TechnicalAnalysisAgent(),
-            SentimentAgent(),
-            ExnessExecutionAgent(),
-            DynamicRiskAgent(),
-            SessionAgent(),
-            NewsAgent(),
-            SocialAgent(),
-            CorrelationAgent(),
-            VolatilityAgent()
-        ]
+        # Initialize Agents (only the enabled ones are imported/constructed)
+        if enabled_agents is None:
+            enabled_agents = settings.ENABLED_AGENTS
+        self.registry = AgentRegistry(enabled_agents)
+        self.agents = self.registry.build()
+        # Polled RSI is only redundant when bars and indicators both run here,
+        # and only once the local RSI has warmed up (AlphaVantage checks per pair)
+        alpha_vantage = self.registry.get("alpha_vantage_agent")
+        if alpha_vantage and self.registry.local_indicators():
+            alpha_vantage.rsi_source = self.registry.get("indicator_agent")
         
-        self.execution_agent = self.agents[5]
-        self.risk_agent = self.agents[6]
+        self.startup_report = {} # {agent_name: {"status", "seconds"}}, filled by start()
+        self.execution_agent = self.registry.by_role("execution")
+        self.risk_agent = self.registry.by_role("risk")
 
     async def system_health_check(self):
         """Verify system integrity before starting."""
@@ -122,63 +246,225 @@ class MainBrain:
 
         self.running = True
         
-        # Start Agents
-        for agent in self.agents:
-            if isinstance(agent, ExnessExecutionAgent):
-                await agent.start(mode=mode)
-            else:
-                await agent.start()
+        # Start Agents (concurrently, so startup takes as long as the slowest one)
+        self.startup_report = await self.start_agents(mode)
             
         # Start Decision Loop
         asyncio.create_task(self.decision_loop())
+        asyncio.create_task(self.metrics_loop())
+        asyncio.create_task(self.maintenance_loop())
         
         logger.info("🚀 System is LIVE!")
 
+    async def start_agent(self, name, agent, mode):
+        """Start one agent under its timeout. Returns (name, status, seconds)."""
+        timeout = self.registry.start_timeout(name)
+        started = time.perf_counter()
+        try:
+            if agent is self.execution_agent:
+                await asyncio.wait_for(agent.start(mode=mode), timeout)
+            else:
+                await asyncio.wait_for(agent.start(), timeout)
+            status = "OK"
+        except asyncio.TimeoutError:
+            status = f"TIMEOUT ({timeout:.0f}s)"
+        except Exception as e:
+            status = f"ERROR ({e})"
+
+        if status != "OK":
+            # Don't leave a half-started agent (open browser, running loop) behind
+            try:
+                await agent.stop()
+            except Exception:
+                pass
+        return name, status, time.perf_counter() - started
+
+    async def start_agents(self, mode):
+        """Start all agents concurrently and log how long each one took."""
+        started = time.perf_counter()
+        results = await asyncio.gather(*(
+            self.start_agent(name, agent, mode)
+            for name, agent in self.registry.agents.items()
+        ))
+
+        report = {}
+        for name, status, elapsed in sorted(results, key=lambda r: r[2], reverse=True):
+            report[name] = {"status": status, "seconds": round(elapsed, 3)}
+            if status == "OK":
+                logger.info(f"⏱️ {name} started in {elapsed:.2f}s")
+            else:
+                logger.error(f"❌ {name} failed to start after {elapsed:.2f}s: {status}")
+
+        total = time.perf_counter() - started
+        sequential = sum(r[2] for r in results)
+        logger.info(f"⏱️ Agents started in {total:.2f}s (sequential would be ~{sequential:.2f}s)")
+        return report
+
     async def stop(self):
         """Stop everything."""
         self.running = False
+        for worker in self.pair_workers.values():
+            worker.cancel()
+        self.pair_workers.clear()
+        self.pair_queues.clear()
         for agent in self.agents:
             await agent.stop()
+        await log_writer.stop() # Flush buffered logs before the pool closes
         await db.disconnect()
         await redis_client.disconnect()
         logger.info("🛑 System Stopped.")
 
     async def decision_loop(self):
-        """Listen for signals and make decisions."""
-        self.pubsub = await redis_client.subscribe("signals:*")
+        """Listen for signals and make decisions.
+
+        Blocks on the subscription until a message arrives, then drains
+        everything already pending so a burst is ingested in one wakeup.
+        Voting runs once per affected pair instead of once per message.
+        """
+        self.pubsub = await self.bus.subscribe("signals:*", "market_status", group="brain")
         
         while self.running:
             try:
-                message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message['type'] in ['message', 'pmessage']:
-                    channel = message['channel']
-                    data = json.loads(message['data'])
-                    
-                    # Extract pair if available
-                    pair = data.get('pair') or data.get('symbol')
+                # Block until the first message (timeout lets us notice self.running)
+                message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None:
+                    continue
+
+                affected_pairs = {} # Ordered set of pairs touched by this batch
+                drained = 0
+                while message is not None:
+                    pair = self.ingest_message(message)
                     if pair:
-                        self.signal_buffer.add_signal(pair, data)
-                        await self.process_voting(pair)
-                
-                await asyncio.sleep(0.1)
+                        affected_pairs[pair] = True
+                    drained += 1
+                    if drained >= self.max_batch_size:
+                        break
+                    # Drain whatever is already buffered without waiting
+                    message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+
+                for pair in affected_pairs:
+                    self.dispatch_voting(pair)
             except Exception as e:
                 logger.error(f"❌ Brain Error: {e}")
                 await asyncio.sleep(1)
 
+    def dispatch_voting(self, pair):
+        """Hand a pair to its decision worker without waiting for the vote.
+
+        Each pair has a worker with a one-slot queue. If an evaluation is
+        already pending the new trigger is dropped: the pending evaluation
+        reads the buffer when it runs, so it already sees the latest signals.
+        """
+        queue = self.pair_queues.get(pair)
+        if queue is None:
+            queue = self.pair_queues[pair] = asyncio.Queue(maxsize=1)
+            self.pair_workers[pair] = asyncio.create_task(self.pair_worker(pair, queue))
+        if queue.full():
+            self.superseded_evaluations += 1
+            return
+        queue.put_nowait(pair)
+
+    async def pair_worker(self, pair, queue):
+        """Run voting (and any resulting risk check/order) for one pair."""
+        loop = asyncio.get_running_loop()
+        while self.running:
+            await queue.get()
+            if self.coalesce_window > 0:
+                await self.coalesce(queue, loop.time() + self.coalesce_max_delay)
+            try:
+                await self.process_voting(pair)
+            except Exception as e:
+                logger.error(f"❌ Decision Worker Error ({pair}): {e}")
+
+    async def coalesce(self, queue, deadline):
+        """Absorb follow-up triggers for a pair until it goes quiet.
+
+        Waits up to coalesce_window after each trigger (debounce), but never
+        past the deadline, so a burst costs one evaluation and at most
+        coalesce_max_delay of added latency.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(queue.get(), timeout=min(self.coalesce_window, remaining))
+            except asyncio.TimeoutError:
+                return
+            self.coalesced_evaluations += 1
+
+    def ingest_message(self, message):
+        """Normalize a pub/sub message into a Signal and buffer it. Returns the pair or None."""
+        if message['type'] not in ('message', 'pmessage'):
+            return None
+        try:
+            # Not bus.decode: any bus works (in-process payloads pass straight through)
+            data = decode_payload(message['data'])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Dropping malformed signal on {message.get('channel')}: {e}")
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        return self.ingest_payload(message['channel'], data)
+
+    def ingest_payload(self, channel, data):
+        """Normalize a decoded payload into a Signal and buffer it. Returns the pair or None."""
+        # Market condition broadcasts update the strategy snapshot
+        if channel == "market_status":
+            self.market_state.update_status(data)
+            return None
+        if channel == "signals:volatility":
+            self.market_state.update_volatility(data)
+
+        signal = Signal.from_message(data, self.signal_buffer.clock())
+        mark(signal.trace, "buffer")
+        if signal.pair:
+            self.signal_buffer.add(signal)
+        return signal.pair
+
+    def get_metrics(self):
+        """Runtime metrics snapshot (latency percentiles per stage and pair)."""
+        return {
+            "latency": tracer.report(),
+            "superseded_evaluations": self.superseded_evaluations,
+            "coalesced_evaluations": self.coalesced_evaluations,
+            "stale_decisions": self.stale_decisions,
+            "redis": redis_client.get_metrics(),
+            "log_writer": log_writer.get_metrics(),
+            "db": db.get_metrics()
+        }
+
+    async def metrics_loop(self):
+        """Periodically expose metrics under the 'metrics:brain' Redis key."""
+        while self.running:
+            await asyncio.sleep(settings.METRICS_INTERVAL)
+            try:
+                metrics = self.get_metrics()
+                if hasattr(self.pubsub, "pending"):
+                    # Streams transport: unacknowledged entries = consumer backlog
+                    metrics["stream_pending"] = await self.pubsub.pending()
+                await redis_client.set("metrics:brain", json.dumps(metrics, default=str))
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to publish metrics: {e}")
+
+    async def maintenance_loop(self):
+        """Keep future partitions created and expire old ones."""
+        while self.running:
+            await asyncio.sleep(settings.DB_MAINTENANCE_INTERVAL)
+            try:
+                await db.maintain_partitions()
+            except Exception as e:
+                logger.warning(f"⚠️ Partition maintenance failed: {e}")
+
     async def determine_strategy(self):
         """
         Determine current strategy based on market conditions.
         Returns: "MOMENTUM_BREAKOUT", "MEAN_REVERSION", or "DEFENSIVE"
         """
-        # Fetch latest status from Redis (or internal cache if we had one)
-        # For now, we'll query Redis directly or assume we have latest data from signals
-        # Ideally, VolatilityAgent and SessionAgent publish to 'market_status'
-        
-        # Simplified: Check last known volatility signal
-        # We need a way to store global state. 
-        # For this implementation, we'll assume default DEFENSIVE unless we see signals.
-        
-        return "DEFENSIVE" # Placeholder for complex logic reading from Redis state
+        # Read from the in-process snapshot kept current by decision_loop
+        return self.market_state.get_strategy()
 
     async def update_learning(self):
         """
@@ -190,39 +476,51 @@ class MainBrain:
         # If Loss -> Decrease Weight
         pass
 
-    async def process_voting(self, pair):
-        """
-        Core Decision Engine: Voting with Adaptive Weights.
-        """
-        votes = self.signal_buffer.get_signals(pair)
-        if not votes:
+    async def execute_decision(self, pair, decision, trace=None):
+        """Risk check and order placement for one decision (called under execution_lock)."""
+        # Risk Check: no order without an approval
+        check_risk = getattr(self.risk_agent, "check_risk", None)
+        if check_risk is None:
+            logger.warning(f"🛡️ No risk check available, not placing {decision} on {pair}")
+            return
+        risk_check = await check_risk(pair, decision)
+        mark(trace, "risk")
+        if not risk_check['allowed']:
+            logger.warning(f"🛡️ Risk Agent blocked {decision} on {pair}: {risk_check['reason']}")
             return
 
+        # Execute
+        execution_agent = self.execution_agent
+        if execution_agent:
+            logger.info(f"🚀 Executing {decision} on {pair}")
+            success = await execution_agent.place_order(
+                symbol=pair,
+                side=decision,
+                volume=risk_check.get('lot_size', 0.01) # Use lot_size from risk_check
+            )
+            mark(trace, "order")
+            if success:
+                logger.info(f"🚀 Trade Executed: {decision} {pair}")
+                # Clear buffer to avoid double entry
+                self.signal_buffer.clear(pair)
+            else:
+                logger.error(f"❌ Failed to execute trade: {decision} {pair}")
+        else:
+            logger.warning("❌ Execution Agent not found.")
+
+    def tally_votes(self, pair, strategy):
+        """Weighted vote for a pair: (decision, buy_power, sell_power, total_weight), or None without votes."""
+        agent_totals = self.signal_buffer.get_agent_totals(pair)
+        if not agent_totals:
+            return None
+
         buy_power = 0.0
         sell_power = 0.0
         total_weight = 0.0
         
-        strategy = await self.determine_strategy()
-        
-        for signal in votes:
-            # Assuming signal structure is {'agent': 'agent_name', 'direction': 'BUY'/'SELL', 'confidence': 0.8}
-            # Need to adapt this based on actual signal structure from agents
-            agent_name = signal.get('agent', 'unknown_agent')
-            direction = signal.get('signal') or signal.get('sentiment') # Handle different keys
-            confidence = signal.get('confidence', 0.5)
-
-            # Normalize direction
-            if isinstance(direction, str):
-                if "BUY" in direction.upper() or "BULLISH" in direction.upper():
-                    direction = "BUY"
-                elif "SELL" in direction.upper() or "BEARISH" in direction.upper():
-                    direction = "SELL"
-                else:
-                    direction = None # Ignore if not clear BUY/SELL
-
-            if not direction:
-                continue
-            
+        # One pass per voting agent (not per signal): the buffer keeps running
+        # confidence sums per agent, so weighting is applied to the aggregates.
+        for agent_name, (buy_confidence, sell_confidence, vote_count) in agent_totals.items():
             # Base Weight
             weight = self.agent_weights.get(agent_name, 1.0)
             
@@ -239,14 +537,9 @@ class MainBrain:
                 #     weight *= 0.5
                 pass # Placeholder
             
-            weighted_score = confidence * weight
-            
-            if direction == "BUY":
-                buy_power += weighted_score
-            elif direction == "SELL":
-                sell_power += weighted_score
-                
-            total_weight += weight
+            buy_power += buy_confidence * weight
+            sell_power += sell_confidence * weight
+            total_weight += weight * vote_count
 
         # Thresholds (Dynamic based on total weight)
         # If we have 10 agents with weight 1.0, max power is 10.0
@@ -259,56 +552,58 @@ class MainBrain:
             decision = "BUY"
         elif sell_power > required_power:
             decision = "SELL"
+        return decision, buy_power, sell_power, total_weight
+
+    async def process_voting(self, pair):
+        """
+        Core Decision Engine: Voting with Adaptive Weights.
+        """
+        strategy = await self.determine_strategy()
+        tally = self.tally_votes(pair, strategy)
+        if tally is None:
+            return
+        decision, buy_power, sell_power, total_weight = tally
+
+        # Trace the newest vote through this decision (tick -> order latency)
+        latest = self.signal_buffer.latest(pair)
+        trace = latest.trace if latest and latest.trace and not latest.trace.get("recorded") else None
+        mark(trace, "vote")
+        try:
+            if decision:
+                logger.info(f"🗳️ Voting Result for {pair}: {decision} (Power: {max(buy_power, sell_power):.2f}/{total_weight:.2f})")
             
-        if decision:
-            logger.info(f"🗳️ Voting Result for {pair}: {decision} (Power: {max(buy_power, sell_power):.2f}/{total_weight:.2f})")
-            
-            # Publish to Dashboard
-            await redis_client.publish("brain_status", json.dumps({
-                "pair": pair,
-                "buy": buy_power,
-                "sell": sell_power,
-                "decision": decision,
-                "confidence": (max(buy_power, sell_power) / total_weight * 100) if total_weight > 0 else 0
-            }))
+                # Publish to Dashboard
+                await self.bus.publish("brain_status", {
+                    "pair": pair,
+                    "buy": buy_power,
+                    "sell": sell_power,
+                    "decision": decision,
+                    "confidence": (max(buy_power, sell_power) / total_weight * 100) if total_weight > 0 else 0
+                })
             
-            # Risk Check
-            risk_agent = next((a for a in self.agents if isinstance(a, DynamicRiskAgent)), None)
-            if risk_agent:
-                risk_check = await risk_agent.check_risk(pair, decision)
-                if not risk_check['allowed']:
-                    logger.warning(f"🛡️ Risk Agent blocked {decision} on {pair}: {risk_check['reason']}")
-                    return
-
-            # Execute
-            execution_agent = next((a for a in self.agents if isinstance(a, ExnessExecutionAgent)), None)
-            if execution_agent:
-                logger.info(f"🚀 Executing {decision} on {pair}")
-                success = await execution_agent.place_order(
-                    symbol=pair,
-                    side=decision,
-                    volume=risk_check.get('lot_size', 0.01) # Use lot_size from risk_check
-                )
-                if success:
-                    logger.info(f"🚀 Trade Executed: {decision} {pair}")
-                    # Clear buffer to avoid double entry
-                    self.signal_buffer.clear(pair)
-                else:
-                    logger.error(f"❌ Failed to execute trade: {decision} {pair}")
+                async with self.execution_lock:
+                    # Another pair's order may have held the lock for a while: votes
+                    # can have expired or been cleared by a fill since the tally
+                    current = self.tally_votes(pair, strategy)
+                    if current is None or current[0] != decision:
+                        self.stale_decisions += 1
+                        logger.info(f"⏭️ Dropping stale {decision} on {pair}: no longer above threshold")
+                    else:
+                        await self.execute_decision(pair, decision, trace)
             else:
-                logger.warning("❌ Execution Agent not found.")
-        else:
-            # Log why no decision was made (CRITICAL for debugging)
-            max_power = max(buy_power, sell_power)
-            direction = "BUY" if buy_power > sell_power else "SELL"
-            confidence_pct = (max_power / total_weight * 100) if total_weight > 0 else 0
-            logger.info(f"⚖️ Brain Decision: HOLD {pair} | {direction} Confidence: {confidence_pct:.1f}% (Threshold: 75%) | Buy: {buy_power:.1f}, Sell: {sell_power:.1f}")
+                # Log why no decision was made (CRITICAL for debugging)
+                max_power = max(buy_power, sell_power)
+                direction = "BUY" if buy_power > sell_power else "SELL"
+                confidence_pct = (max_power / total_weight * 100) if total_weight > 0 else 0
+                logger.info(f"⚖️ Brain Decision: HOLD {pair} | {direction} Confidence: {confidence_pct:.1f}% (Threshold: 75%) | Buy: {buy_power:.1f}, Sell: {sell_power:.1f}")
             
-            # Publish to Dashboard
-            await redis_client.publish("brain_status", json.dumps({
-                "pair": pair,
-                "buy": buy_power,
-                "sell": sell_power,
-                "decision": "HOLD",
-                "confidence": confidence_pct
-            }))
+                # Publish to Dashboard
+                await self.bus.publish("brain_status", {
+                    "pair": pair,
+                    "buy": buy_power,
+                    "sell": sell_power,
+                    "decision": "HOLD",
+                    "confidence": confidence_pct
+                })
+        finally:
+            tracer.record(trace, pair)
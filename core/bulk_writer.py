@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from core.database import db
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+class BulkWriter:
+    """Buffers rows in memory and COPYs them into a table in batches.
+
+    write() is synchronous and never touches Postgres, so callers on the
+    trading path can't be held up by the database. A background task
+    flushes every `flush_interval` seconds, or sooner once `max_batch` rows
+    are waiting. When `max_buffer` rows are queued (e.g. the database is
+    down) the overflow policy applies: "drop_oldest" or "drop_newest".
+    """
+    def __init__(self, table, columns, max_batch=500, flush_interval=1.0, max_buffer=50000, overflow="drop_oldest"):
+        self.table = table
+        self.columns = columns
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.overflow = overflow
+        self.buffer = deque()
+        self.wakeup = None
+        self.task = None
+        self.stopping = False
+
+        # Metrics
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.errors = 0
+        self.last_flush_ms = 0.0
+
+    def write(self, record):
+        """Queue one row (a tuple in `columns` order)."""
+        if len(self.buffer) >= self.max_buffer:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            self.buffer.popleft()
+        self.buffer.append(record)
+
+        if self.task is None:
+            self.start()
+        if self.wakeup and len(self.buffer) >= self.max_batch:
+            self.wakeup.set()
+
+    def start(self):
+        """Start the flush task (needs a running event loop; retried on next write)."""
+        if self.task or self.stopping:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.wakeup = asyncio.Event()
+        self.task = loop.create_task(self._run())
+
+    async def stop(self):
+        """Let the flush task finish its current batch, then write out whatever is buffered."""
+        self.stopping = True
+        if self.task:
+            self.wakeup.set()
+            await self.task
+            self.task = None
+        await self.flush()
+
+    async def _run(self):
+        while not self.stopping:
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeup.clear()
+            if self.stopping:
+                return # stop() does the final flush
+            await self.flush()
+
+    async def flush(self):
+        if not db.pool:
+            return # Keep buffering until the database is connected
+        while self.buffer:
+            batch = [self.buffer.popleft() for _ in range(min(self.max_batch, len(self.buffer)))]
+            started = time.perf_counter()
+            try:
+                async with db.timed(f"copy_{self.table}") as conn:
+                    await conn.copy_records_to_table(self.table, records=batch, columns=self.columns)
+                self.written += len(batch)
+            except asyncio.CancelledError:
+                # Cancelled mid-COPY (e.g. loop shutdown): keep the batch for the next flush
+                self.buffer.extendleft(reversed(batch))
+                raise
+            except Exception as e:
+                self.errors += 1
+                self.dropped += len(batch)
+                logger.error(f"❌ Bulk write to {self.table} failed ({len(batch)} rows dropped): {e}")
+            self.flushes += 1
+            self.last_flush_ms = (time.perf_counter() - started) * 1000
+
+    def get_metrics(self):
+        return {
+            "buffered": len(self.buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "errors": self.errors,
+            "last_flush_ms": round(self.last_flush_ms, 3)
+        }
+
+# Agent logs (BaseAgent.log)
+log_writer = BulkWriter(
+    "logs", ["timestamp", "level", "message", "agent_id"],
+    max_batch=settings.LOG_BATCH_SIZE,
+    flush_interval=settings.LOG_FLUSH_INTERVAL,
+    max_buffer=settings.LOG_BUFFER_MAX,
+    overflow=settings.LOG_OVERFLOW
+)
@@ -1,12 +1,75 @@
 import asyncpg
 import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 from config.settings import settings
+from core.tracing import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
+PARTITION_DAYS = {"daily": 1, "weekly": 7}
+
+# Range-partitioned on timestamp. id/timestamp are added to every table; the
+# primary key is (id, timestamp) since it must include the partition key.
+# BRIN on timestamp is tiny and suits append-only time order; B-trees serve
+# the per-pair / per-agent lookups.
+TABLES = {
+    "logs": {
+        "columns": """level VARCHAR(20),
+                message TEXT,
+                agent_id VARCHAR(50)""",
+        "indexes": [
+            ("timestamp_brin", "USING BRIN (timestamp)"),
+            ("agent_timestamp", "(agent_id, timestamp)"),
+        ],
+        "interval": settings.LOG_PARTITION_INTERVAL,
+        "retention": "LOG_RETENTION_DAYS",
+    },
+    "signals": {
+        "columns": """pair VARCHAR(20),
+                agent_id VARCHAR(50),
+                signal VARCHAR(10),
+                confidence FLOAT,
+                data JSONB""",
+        "indexes": [
+            ("timestamp_brin", "USING BRIN (timestamp)"),
+            ("pair_timestamp", "(pair, timestamp)"),
+            ("agent_timestamp", "(agent_id, timestamp)"),
+        ],
+        "interval": settings.SIGNAL_PARTITION_INTERVAL,
+        "retention": "SIGNAL_RETENTION_DAYS",
+    },
+    "trades": {
+        "columns": """pair VARCHAR(20),
+                direction VARCHAR(10),
+                entry_price FLOAT,
+                exit_price FLOAT,
+                pnl FLOAT,
+                status VARCHAR(20)""",
+        "indexes": [
+            ("timestamp_brin", "USING BRIN (timestamp)"),
+            ("pair_timestamp", "(pair, timestamp)"),
+            ("status_timestamp", "(status, timestamp)"),
+        ],
+        "interval": settings.TRADE_PARTITION_INTERVAL,
+        "retention": "TRADE_RETENTION_DAYS",
+    },
+}
+
+def partition_start(ts, interval):
+    """Lower bound of the partition holding `ts` (weekly partitions start on Monday)."""
+    day = datetime(ts.year, ts.month, ts.day)
+    if interval == "weekly":
+        day -= timedelta(days=day.weekday())
+    return day
+
 class Database:
     def __init__(self):
         self.pool = None
+        self.pool_wait = LatencyHistogram()
+        self.query_latency = {} # query name (or "raw") -> LatencyHistogram
+        self.errors = 0
 
     async def connect(self):
         """Create a connection pool to PostgreSQL"""
@@ -19,7 +82,12 @@ class Database:
                 password=settings.DB_PASSWORD,
                 database=settings.DB_NAME,
                 host=settings.DB_HOST,
-                port=settings.DB_PORT
+                port=settings.DB_PORT,
+                min_size=settings.DB_POOL_MIN,
+                max_size=settings.DB_POOL_MAX,
+                command_timeout=settings.DB_COMMAND_TIMEOUT,
+                max_inactive_connection_lifetime=settings.DB_MAX_INACTIVE_LIFETIME,
+                statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE
             )
             logger.info("✅ Connected to PostgreSQL")
             await self.init_schema()
@@ -34,55 +102,131 @@ class Database:
             logger.info("✅ Disconnected from PostgreSQL")
 
     async def init_schema(self):
-        """Initialize database schema"""
-        async with self.pool.acquire() as conn:
-            # Table: Logs
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS logs (
-                    id SERIAL PRIMARY KEY,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    level VARCHAR(20),
-                    message TEXT,
-                    agent_id VARCHAR(50)
-                );
-            """)
-            
-            # Table: Signals
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS signals (
-                    id SERIAL PRIMARY KEY,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    pair VARCHAR(20),
-                    agent_id VARCHAR(50),
-                    signal VARCHAR(10),
-                    confidence FLOAT,
-                    data JSONB
-                );
-            """)
-
-            # Table: Trades
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS trades (
-                    id SERIAL PRIMARY KEY,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    pair VARCHAR(20),
-                    direction VARCHAR(10),
-                    entry_price FLOAT,
-                    exit_price FLOAT,
-                    pnl FLOAT,
-                    status VARCHAR(20)
-                );
-            """)
+        """Initialize database schema (time-partitioned tables)"""
+        async with self.timed("init_schema") as conn:
+            for table, spec in TABLES.items():
+                async with conn.transaction():
+                    await self._create_partitioned(conn, table, spec)
             logger.info("✅ Database schema initialized")
+        await self.maintain_partitions()
+
+    async def _create_partitioned(self, conn, table, spec):
+        """Create a range-partitioned parent, its default partition and indexes."""
+        kind = await conn.fetchval("SELECT relkind FROM pg_class WHERE oid = to_regclass($1)", table)
+        if kind == 'r':
+            # Pre-partitioning heap table: keep its rows aside under {table}_legacy
+            legacy = f"{table}_legacy"
+            await conn.execute(f"ALTER TABLE {table} RENAME TO {legacy};")
+            await conn.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey;")
+            await conn.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq RENAME TO {legacy}_id_seq;")
+            for name, _ in spec["indexes"]:
+                await conn.execute(f"ALTER INDEX IF EXISTS idx_{table}_{name} RENAME TO idx_{legacy}_{name};")
+            logger.warning(f"⚠️ Moved non-partitioned '{table}' to '{legacy}'")
+
+        await conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id BIGSERIAL,
+                timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                {spec["columns"]},
+                PRIMARY KEY (id, timestamp)
+            ) PARTITION BY RANGE (timestamp);
+        """)
+        # Catches rows outside every range partition (e.g. if maintenance falls behind)
+        await conn.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT;")
+        for name, definition in spec["indexes"]:
+            await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{name} ON {table} {definition};")
+
+    async def maintain_partitions(self, now=None):
+        """Create upcoming partitions and drop the ones past retention."""
+        now = now or datetime.utcnow()
+        created = []
+        dropped = []
+        async with self.timed("maintain_partitions") as conn:
+            for table, spec in TABLES.items():
+                step = timedelta(days=PARTITION_DAYS[spec["interval"]])
+                start = partition_start(now, spec["interval"])
+                for i in range(settings.DB_PARTITIONS_AHEAD + 1):
+                    lower = start + step * i
+                    name = f"{table}_p{lower:%Y%m%d}"
+                    try:
+                        await conn.execute(f"""
+                            CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table}
+                            FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{lower + step:%Y-%m-%d}');
+                        """)
+                        created.append(name)
+                    except asyncpg.PostgresError as e:
+                        # Rows for this range already landed in {table}_default
+                        logger.error(f"❌ Could not create partition {name}: {e}")
+
+                retention = getattr(settings, spec["retention"])
+                if retention <= 0:
+                    continue
+                cutoff = now - timedelta(days=retention)
+                rows = await conn.fetch("""
+                    SELECT c.relname FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = $1::regclass
+                """, table)
+                for row in rows:
+                    name = row['relname']
+                    try:
+                        lower = datetime.strptime(name[len(table) + 2:], "%Y%m%d")
+                    except ValueError:
+                        continue # {table}_default
+                    if lower + step <= cutoff:
+                        # Dropping a whole partition: no DELETE, no vacuum debt
+                        await conn.execute(f"DROP TABLE IF EXISTS {name};")
+                        dropped.append(name)
+
+        if dropped:
+            logger.info(f"🧹 Dropped expired partitions: {', '.join(dropped)}")
+        return {"created": created, "dropped": dropped}
+
+    @asynccontextmanager
+    async def timed(self, name):
+        """Acquire a connection, recording pool wait and query time (ms) under `name`.
+
+        Every pooled access goes through here (including BulkWriter COPYs),
+        so get_metrics() covers the real traffic.
+        """
+        start = time.perf_counter()
+        async with self.pool.acquire() as conn:
+            acquired = time.perf_counter()
+            self.pool_wait.add((acquired - start) * 1000)
+            try:
+                yield conn
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                histogram = self.query_latency.get(name)
+                if histogram is None:
+                    histogram = self.query_latency[name] = LatencyHistogram()
+                histogram.add((time.perf_counter() - acquired) * 1000)
 
     async def execute(self, query, *args):
         """Execute a query (INSERT, UPDATE, DELETE)"""
-        async with self.pool.acquire() as conn:
+        async with self.timed("raw") as conn:
             return await conn.execute(query, *args)
 
     async def fetch(self, query, *args):
         """Fetch results (SELECT)"""
-        async with self.pool.acquire() as conn:
+        async with self.timed("raw") as conn:
             return await conn.fetch(query, *args)
 
+    def get_metrics(self):
+        metrics = {
+            "pool_wait_ms": self.pool_wait.percentiles(),
+            "query_ms": {name: h.percentiles() for name, h in self.query_latency.items()},
+            "errors": self.errors
+        }
+        if self.pool:
+            metrics["pool"] = {
+                "size": self.pool.get_size(),
+                "idle": self.pool.get_idle_size(),
+                "min": self.pool.get_min_size(),
+                "max": self.pool.get_max_size()
+            }
+        return metrics
+
 db = Database()
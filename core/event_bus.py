@@ -0,0 +1,137 @@
+import asyncio
+import fnmatch
+import logging
+
+logger = logging.getLogger(__name__)
+
+class LocalSubscription:
+    """Queue of bus messages for one in-process subscriber.
+
+    Mirrors the parts of the redis PubSub API the agents use
+    (get_message, listen, subscribe/psubscribe, close). Payloads are the
+    publisher's Python objects, shared between subscribers: treat them as
+    read-only.
+    """
+    def __init__(self, bus, maxsize):
+        self.bus = bus
+        self.queue = asyncio.Queue(maxsize)
+        self.channels = set()
+        self.patterns = set()
+        self.dropped = 0
+
+    def deliver(self, message):
+        if self.queue.full():
+            # Like a slow pub/sub client: drop the oldest, keep the newest
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+        self.bus.invalidate()
+
+    async def psubscribe(self, *patterns):
+        self.patterns.update(patterns)
+        self.bus.invalidate()
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        if not self.queue.empty():
+            return self.queue.get_nowait()
+        if timeout is None:
+            return await self.queue.get()
+        if not timeout:
+            return None
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def close(self):
+        self.bus.unsubscribe(self)
+
+class InProcessBus:
+    """Zero-serialization publish/subscribe for agents sharing one event loop.
+
+    Same API as RedisClient.publish/subscribe, including 'signals:*' style
+    patterns. Channels matching `bridge_patterns` are also handed to
+    `bridge` (an async callable) so Redis readers such as the dashboard and
+    external processes still see them.
+    """
+    def __init__(self, bridge=None, bridge_patterns=(), maxsize=10000):
+        self.bridge = bridge
+        self.bridge_patterns = list(bridge_patterns)
+        self.maxsize = maxsize
+        self.subscriptions = []
+        self.routes = {} # {channel: ([(subscription, pattern)], bridged)}, rebuilt on (un)subscribe
+
+        # Metrics
+        self.published = 0
+        self.delivered = 0
+        self.bridged = 0
+
+    def invalidate(self):
+        self.routes.clear()
+
+    def unsubscribe(self, subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            self.invalidate()
+
+    def route(self, channel):
+        route = self.routes.get(channel)
+        if route is None:
+            targets = []
+            for subscription in self.subscriptions:
+                if channel in subscription.channels:
+                    targets.append((subscription, None))
+                    continue
+                for pattern in subscription.patterns:
+                    if fnmatch.fnmatchcase(channel, pattern):
+                        targets.append((subscription, pattern))
+                        break
+            bridged = self.bridge is not None and any(
+                fnmatch.fnmatchcase(channel, p) for p in self.bridge_patterns
+            )
+            route = self.routes[channel] = (targets, bridged)
+        return route
+
+    async def publish(self, channel, message):
+        """Deliver the object itself to every matching subscriber."""
+        targets, bridged = self.route(channel)
+        self.published += 1
+        for subscription, pattern in targets:
+            if pattern is None:
+                subscription.deliver({'type': 'message', 'pattern': None, 'channel': channel, 'data': message})
+            else:
+                subscription.deliver({'type': 'pmessage', 'pattern': pattern, 'channel': channel, 'data': message})
+        self.delivered += len(targets)
+        if bridged:
+            self.bridged += 1
+            await self.bridge(channel, message)
+
+    def decode(self, message):
+        """Payloads are already Python objects: nothing to decode."""
+        return message['data']
+
+    async def subscribe(self, *channels, group=None):
+        subscription = LocalSubscription(self, self.maxsize)
+        self.subscriptions.append(subscription)
+        for channel in channels:
+            if "*" in channel:
+                await subscription.psubscribe(channel)
+            else:
+                await subscription.subscribe(channel)
+        return subscription
+
+    def get_metrics(self):
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "bridged": self.bridged,
+            "subscribers": len(self.subscriptions),
+            "dropped": sum(s.dropped for s in self.subscriptions)
+        }
@@ -0,0 +1,160 @@
+import math
+from collections import deque
+
+# Streaming indicators: each update() is O(1) and returns None until the
+# indicator has seen enough data to be meaningful.
+
+class EMA:
+    """Exponential moving average, seeded with the SMA of the first `period` values."""
+    def __init__(self, period):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = None
+        self._seed = 0.0
+        self._count = 0
+
+    def update(self, x):
+        if self.value is None:
+            self._seed += x
+            self._count += 1
+            if self._count == self.period:
+                self.value = self._seed / self.period
+            return self.value
+        self.value += self.alpha * (x - self.value)
+        return self.value
+
+class Wilder:
+    """Wilder's smoothing (RMA), seeded with the mean of the first `period` values."""
+    def __init__(self, period):
+        self.period = period
+        self.value = None
+        self._seed = 0.0
+        self._count = 0
+
+    def update(self, x):
+        if self.value is None:
+            self._seed += x
+            self._count += 1
+            if self._count == self.period:
+                self.value = self._seed / self.period
+            return self.value
+        self.value += (x - self.value) / self.period
+        return self.value
+
+class RSI:
+    def __init__(self, period=14):
+        self.gain = Wilder(period)
+        self.loss = Wilder(period)
+        self.prev = None
+        self.value = None
+
+    def update(self, close):
+        if self.prev is None:
+            self.prev = close
+            return None
+        change = close - self.prev
+        self.prev = close
+        gain = self.gain.update(change if change > 0 else 0.0)
+        loss = self.loss.update(-change if change < 0 else 0.0)
+        if gain is None:
+            return None
+        self.value = 100.0 if loss == 0 else 100.0 - 100.0 / (1.0 + gain / loss)
+        return self.value
+
+class ATR:
+    def __init__(self, period=14):
+        self.range = Wilder(period)
+        self.prev_close = None
+        self.value = None
+
+    def update(self, high, low, close):
+        if self.prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.value = self.range.update(true_range)
+        return self.value
+
+class Bollinger:
+    """Bands from running sum / sum of squares over a fixed window: (middle, upper, lower)."""
+    def __init__(self, period=20, k=2.0):
+        self.period = period
+        self.k = k
+        self.window = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.value = None
+
+    def update(self, x):
+        self.window.append(x)
+        self.total += x
+        self.total_sq += x * x
+        if len(self.window) > self.period:
+            old = self.window.popleft()
+            self.total -= old
+            self.total_sq -= old * old
+        if len(self.window) < self.period:
+            return None
+        mean = self.total / self.period
+        std = math.sqrt(max(self.total_sq / self.period - mean * mean, 0.0))
+        self.value = (mean, mean + self.k * std, mean - self.k * std)
+        return self.value
+
+class MACD:
+    """(macd, signal, histogram)"""
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+        self.value = None
+
+    def update(self, x):
+        fast = self.fast.update(x)
+        slow = self.slow.update(x)
+        if fast is None or slow is None:
+            return None
+        line = fast - slow
+        signal = self.signal.update(line)
+        if signal is None:
+            return None
+        self.value = (line, signal, line - signal)
+        return self.value
+
+class IndicatorSet:
+    """All indicators for one pair/timeframe, fed one closed bar at a time."""
+    def __init__(self, rsi=14, ema=20, atr=14, bollinger=20, macd=(12, 26, 9)):
+        self.rsi = RSI(rsi)
+        self.ema = EMA(ema)
+        self.atr = ATR(atr)
+        self.bollinger = Bollinger(bollinger)
+        self.macd = MACD(*macd)
+        # Bars until state built on a dirty (gap-affected) bar has washed out
+        self.settle = max(rsi, ema, atr, bollinger, macd[1] + macd[2])
+        self.dirty = 0
+
+    def update(self, bar):
+        """Returns {indicator: value} for the indicators that are warmed up."""
+        close = bar["close"]
+        if bar.get("dirty"):
+            self.dirty = self.settle
+        elif self.dirty:
+            self.dirty -= 1
+
+        values = {}
+        rsi = self.rsi.update(close)
+        if rsi is not None:
+            values["RSI"] = {"value": rsi}
+        ema = self.ema.update(close)
+        if ema is not None:
+            values["EMA"] = {"value": ema, "period": self.ema.period}
+        atr = self.atr.update(bar["high"], bar["low"], close)
+        if atr is not None:
+            values["ATR"] = {"value": atr}
+        bands = self.bollinger.update(close)
+        if bands is not None:
+            values["BBANDS"] = {"value": bands[0], "upper": bands[1], "lower": bands[2]}
+        macd = self.macd.update(close)
+        if macd is not None:
+            values["MACD"] = {"value": macd[0], "signal": macd[1], "histogram": macd[2]}
+        return values
@@ -0,0 +1,82 @@
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MarketState:
+    """In-process snapshot of market conditions, fed by agent broadcasts.
+
+    VolatilityAgent publishes on 'signals:volatility', SessionAgent and
+    CalendarAgent on 'market_status'. The strategy is recomputed when an
+    update arrives, so reading it during voting is O(1).
+    """
+
+    NEWS_ALERT_SECONDS = 30 * 60 # Stay defensive this long after a news alert
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.volatility = None # WAIT_CONSOLIDATION / NORMAL / BREAKOUT_WATCH
+        self.atr = None
+        self.active_sessions = []
+        self.liquidity = None # LOW / MEDIUM / HIGH
+        self.news_events = []
+        self.news_until = 0.0
+        self.updated_at = None
+        self.strategy = "DEFENSIVE"
+
+    def update_volatility(self, data):
+        """Apply a VolatilityAgent payload."""
+        self.volatility = data.get('state', self.volatility)
+        self.atr = data.get('atr', self.atr)
+        self._refresh()
+
+    def update_status(self, data):
+        """Apply a 'market_status' payload (session update or calendar news alert)."""
+        now = self.clock()
+        if data.get('type') == 'news_alert':
+            self.news_events = data.get('events', [])
+            self.news_until = now + self.NEWS_ALERT_SECONDS
+        else:
+            self.active_sessions = data.get('active_sessions', self.active_sessions)
+            self.liquidity = data.get('liquidity', self.liquidity)
+            if data.get('is_news_event'):
+                self.news_until = now + self.NEWS_ALERT_SECONDS
+        self._refresh()
+
+    def _refresh(self):
+        """Recompute the strategy from the latest volatility and liquidity."""
+        self.updated_at = self.clock()
+        if not self.volatility or not self.liquidity or self.liquidity == "LOW":
+            strategy = "DEFENSIVE"
+        elif self.volatility == "BREAKOUT_WATCH":
+            strategy = "MOMENTUM_BREAKOUT"
+        elif self.volatility == "WAIT_CONSOLIDATION":
+            strategy = "MEAN_REVERSION"
+        elif self.liquidity == "HIGH":
+            strategy = "MOMENTUM_BREAKOUT"
+        else:
+            strategy = "MEAN_REVERSION"
+
+        if strategy != self.strategy:
+            logger.info(f"🧭 Strategy: {self.strategy} -> {strategy} (Volatility: {self.volatility}, Liquidity: {self.liquidity})")
+            self.strategy = strategy
+
+    def news_alert_active(self):
+        return self.clock() < self.news_until
+
+    def get_strategy(self):
+        """Current strategy: "MOMENTUM_BREAKOUT", "MEAN_REVERSION" or "DEFENSIVE"."""
+        if self.news_alert_active():
+            return "DEFENSIVE"
+        return self.strategy
+
+    def snapshot(self):
+        return {
+            "volatility": self.volatility,
+            "atr": self.atr,
+            "active_sessions": self.active_sessions,
+            "liquidity": self.liquidity,
+            "news_alert": self.news_alert_active(),
+            "news_events": self.news_events,
+            "strategy": self.get_strategy()
+        }
@@ -1,13 +1,407 @@
 import redis.asyncio as redis
+import asyncio
+import fnmatch
 import json
 import logging
+import os
+import socket
+import time
+from collections import deque
 from config.settings import settings
+from core.event_bus import InProcessBus
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+class JsonCodec:
+    """JSON on the wire (orjson when installed). Readable by the dashboard."""
+    name = "json"
+
+    def encode(self, obj):
+        if orjson:
+            return orjson.dumps(obj)
+        return json.dumps(obj).encode()
+
+    def decode(self, raw):
+        if orjson:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+class MsgpackCodec:
+    """Compact binary payloads for high-volume channels."""
+    name = "msgpack"
+
+    def encode(self, obj):
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def decode(self, raw):
+        return msgpack.unpackb(raw, raw=False)
+
+json_codec = JsonCodec()
+CODECS = {"json": json_codec}
+if msgpack:
+    CODECS["msgpack"] = MsgpackCodec()
+
+# Bus payloads are objects/arrays: msgpack maps/arrays never start with these
+_JSON_LEAD_BYTES = frozenset(b'{[" \t\r\n')
+
+def decode_payload(raw):
+    """Decode a bus payload whatever codec produced it.
+
+    JSON and msgpack are told apart by the first byte, so consumers don't
+    need to know which codec a channel was configured with. Non-JSON text
+    (e.g. formatted log lines) is returned as a string.
+    """
+    if not isinstance(raw, (bytes, bytearray, str)):
+        return raw # Already a Python object
+    if not raw:
+        return None
+    if isinstance(raw, str) or raw[0] in _JSON_LEAD_BYTES or "msgpack" not in CODECS:
+        try:
+            return json_codec.decode(raw)
+        except ValueError:
+            return raw.decode(errors="replace") if isinstance(raw, (bytes, bytearray)) else raw
+    try:
+        return CODECS["msgpack"].decode(raw)
+    except ValueError:
+        return raw.decode(errors="replace")
+
+class ChannelCodecs:
+    """Negotiates the codec per channel from settings.REDIS_CHANNEL_CODECS.
+
+    Patterns are matched in order with fnmatch; unmatched channels use JSON.
+    Results are cached per channel name.
+    """
+    def __init__(self, rules):
+        self.rules = []
+        for pattern, name in rules:
+            codec = CODECS.get(name)
+            if codec is None:
+                logger.warning(f"⚠️ Codec '{name}' unavailable for '{pattern}', using JSON.")
+                codec = json_codec
+            self.rules.append((pattern, codec))
+        self.cache = {}
+
+    def codec_for(self, channel):
+        codec = self.cache.get(channel)
+        if codec is None:
+            codec = json_codec
+            for pattern, candidate in self.rules:
+                if fnmatch.fnmatchcase(channel, pattern):
+                    codec = candidate
+                    break
+            self.cache[channel] = codec
+        return codec
+
+    def encode(self, channel, message):
+        """Encode dict/list payloads; str/bytes are assumed to be encoded already."""
+        if isinstance(message, (str, bytes, bytearray)):
+            return message
+        return self.codec_for(channel).encode(message)
+
+class Subscription:
+    """Wraps a redis PubSub so channel names come back as str.
+
+    Payloads stay raw bytes; use RedisClient.decode() to get objects.
+    """
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+        self.names = {} # {bytes channel: str channel}
+
+    def _name(self, raw):
+        if raw is None or isinstance(raw, str):
+            return raw
+        name = self.names.get(raw)
+        if name is None:
+            name = self.names[raw] = raw.decode()
+        return name
+
+    def _convert(self, message):
+        if message is not None:
+            message['channel'] = self._name(message.get('channel'))
+            message['pattern'] = self._name(message.get('pattern'))
+        return message
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        return self._convert(await self.pubsub.get_message(
+            ignore_subscribe_messages=ignore_subscribe_messages, timeout=timeout
+        ))
+
+    async def listen(self):
+        async for message in self.pubsub.listen():
+            yield self._convert(message)
+
+    def __getattr__(self, name):
+        # subscribe/psubscribe/unsubscribe/close etc. go straight to PubSub
+        return getattr(self.pubsub, name)
+
+class BatchPublisher:
+    """Accumulates publishes and flushes them to Redis in one pipeline.
+
+    A flush happens once `max_batch` messages are pending or `linger`
+    seconds after the first pending message, whichever comes first. If
+    `max_pending` is reached the caller flushes inline (backpressure).
+    Flushes are serialized by a lock so a channel's messages stay in order.
+    """
+    def __init__(self, client, max_batch=256, linger=0.0005, max_pending=10000, send=None):
+        self.client = client
+        self.send = send or (lambda pipe, channel, message: pipe.publish(channel, message))
+        self.max_batch = max_batch
+        self.linger = linger
+        self.max_pending = max_pending
+        self.pending = [] # [(channel, encoded message)]
+        self.wakeup = asyncio.Event()
+        self.lock = asyncio.Lock() # Timed and inline (backpressure) flushes take turns
+        self.task = None
+        self.stopping = False
+
+        # Metrics
+        self.published = 0
+        self.flushes = 0
+        self.errors = 0
+        self.last_flush_size = 0
+        self.max_flush_size = 0
+
+    def start(self):
+        if not self.task:
+            self.stopping = False
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Let the flush task finish its current pipeline, then send whatever is still buffered."""
+        self.stopping = True
+        if self.task:
+            self.wakeup.set()
+            await self.task
+            self.task = None
+        await self.flush()
+
+    async def publish(self, channel, message):
+        """Queue a message for the next pipeline flush."""
+        self.pending.append((channel, message))
+        depth = len(self.pending)
+        if depth >= self.max_pending:
+            await self.flush()
+        elif depth == 1 or depth >= self.max_batch:
+            self.wakeup.set()
+
+    async def _run(self):
+        while not self.stopping:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            if self.stopping:
+                return # stop() does the final flush
+            if len(self.pending) < self.max_batch:
+                await asyncio.sleep(self.linger) # Let the batch fill
+            await self.flush()
+
+    async def flush(self):
+        async with self.lock:
+            while self.pending:
+                # Take everything queued so far; later publishes wait for the next pass
+                pending, self.pending = self.pending, []
+                for i in range(0, len(pending), self.max_batch):
+                    batch = pending[i:i + self.max_batch]
+                    pipe = self.client.pipeline(transaction=False)
+                    for channel, message in batch:
+                        self.send(pipe, channel, message)
+                    try:
+                        await pipe.execute()
+                        self.published += len(batch)
+                    except asyncio.CancelledError:
+                        # Cancelled mid-send (e.g. loop shutdown): keep the unsent rest queued, in order
+                        self.pending[:0] = pending[i:]
+                        raise
+                    except Exception as e:
+                        self.errors += 1
+                        logger.error(f"❌ Redis batch publish failed ({len(batch)} messages dropped): {e}")
+                    self.flushes += 1
+                    self.last_flush_size = len(batch)
+                    self.max_flush_size = max(self.max_flush_size, len(batch))
+
+    def get_metrics(self):
+        return {
+            "queue_depth": len(self.pending),
+            "published": self.published,
+            "flushes": self.flushes,
+            "errors": self.errors,
+            "last_flush_size": self.last_flush_size,
+            "max_flush_size": self.max_flush_size,
+            "avg_flush_size": round(self.published / self.flushes, 2) if self.flushes else 0
+        }
+
+class StreamSubscription:
+    """Consumer-group reader over Redis Streams with the Subscription API.
+
+    Patterns like 'signals:*' map to one stream per family (see
+    RedisClient.stream_for); entries are filtered by their original
+    channel. On start, and every claim_interval seconds, entries left
+    pending by other consumers of the group for longer than claim_idle_ms
+    (e.g. a crashed process) are claimed with XAUTOCLAIM; the consumer then
+    re-reads its own pending entries before new ones. Entries handed out by
+    get_message() are acknowledged on the next read.
+    Non-stream channels are served by an inner pub/sub Subscription.
+    """
+    def __init__(self, client, streams, group, consumer, pubsub=None, batch=256, block_ms=1000,
+                 claim_idle_ms=60000, claim_interval=30):
+        self.client = client
+        self.streams = streams # {stream key: [channel patterns]}
+        self.group = group
+        self.consumer = consumer
+        self.pubsub = pubsub
+        self.batch = batch
+        self.block_ms = block_ms
+        self.buffer = deque()
+        self.unacked = {} # {stream key: [entry ids]}
+        self.catching_up = True
+        self.claim_idle_ms = claim_idle_ms
+        self.claim_interval = claim_interval
+        self.last_claim = 0.0
+
+        # Metrics
+        self.delivered = 0
+        self.acked = 0
+        self.claimed = 0
+
+    async def setup(self):
+        for stream in self.streams:
+            try:
+                await self.client.xgroup_create(stream, self.group, id="$", mkstream=True)
+                logger.info(f"🧵 Created consumer group '{self.group}' on {stream}")
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        await self.claim_stale()
+
+    async def claim_stale(self):
+        """Take over entries stuck with dead consumers, then drop those consumers once empty."""
+        self.last_claim = time.monotonic()
+        claimed = 0
+        for stream in self.streams:
+            start = "0-0"
+            while True:
+                result = await self.client.xautoclaim(
+                    stream, self.group, self.consumer, self.claim_idle_ms,
+                    start_id=start, count=self.batch, justid=True
+                )
+                start, ids = result[0], result[1]
+                claimed += len(ids)
+                if start in (b"0-0", "0-0"):
+                    break
+
+            for info in await self.client.xinfo_consumers(stream, self.group):
+                name = info["name"].decode() if isinstance(info["name"], bytes) else info["name"]
+                # Consumer names carry the pid, so restarts leave idle entries behind
+                if name != self.consumer and info["pending"] == 0 and info["idle"] > self.claim_idle_ms:
+                    await self.client.xgroup_delconsumer(stream, self.group, name)
+
+        if claimed:
+            self.claimed += claimed
+            self.catching_up = True # Claimed entries are now in our pending list
+            logger.warning(f"🧵 '{self.consumer}' claimed {claimed} stale entries for group '{self.group}'")
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=0.0):
+        if self.pubsub:
+            message = await self.pubsub.get_message(ignore_subscribe_messages=ignore_subscribe_messages)
+            if message:
+                return message
+        if not self.buffer:
+            await self._fill(timeout)
+        return self.buffer.popleft() if self.buffer else None
+
+    async def listen(self):
+        while True:
+            message = await self.get_message(timeout=self.block_ms / 1000)
+            if message:
+                yield message
+
+    async def _fill(self, timeout):
+        await self.ack()
+        if time.monotonic() - self.last_claim >= self.claim_interval:
+            await self.claim_stale()
+        if self.catching_up:
+            entries = await self.client.xreadgroup(
+                self.group, self.consumer, {stream: "0" for stream in self.streams}, count=self.batch
+            )
+            if not any(items for _, items in entries):
+                self.catching_up = False
+        if not self.catching_up:
+            block = None
+            if timeout:
+                block = int(timeout * 1000)
+                if self.pubsub:
+                    # Don't starve the pub/sub side while blocked on streams
+                    block = min(block, self.block_ms)
+            entries = await self.client.xreadgroup(
+                self.group, self.consumer, {stream: ">" for stream in self.streams},
+                count=self.batch, block=block
+            )
+
+        for stream, items in entries or []:
+            stream = stream.decode() if isinstance(stream, bytes) else stream
+            patterns = self.streams[stream]
+            ids = self.unacked.setdefault(stream, [])
+            for entry_id, fields in items:
+                ids.append(entry_id)
+                if not fields:
+                    continue # Trimmed away by MAXLEN while pending
+                channel = fields[b"c"].decode()
+                for pattern in patterns:
+                    if fnmatch.fnmatchcase(channel, pattern):
+                        self.buffer.append({
+                            'type': 'pmessage', 'pattern': pattern, 'channel': channel,
+                            'data': fields[b"d"], 'id': entry_id
+                        })
+                        self.delivered += 1
+                        break
+
+    async def ack(self):
+        for stream, ids in self.unacked.items():
+            if ids:
+                await self.client.xack(stream, self.group, *ids)
+                self.acked += len(ids)
+        self.unacked = {}
+
+    async def pending(self):
+        """Entries delivered to this group but not yet acknowledged, per stream."""
+        counts = {}
+        for stream in self.streams:
+            summary = await self.client.xpending(stream, self.group)
+            counts[stream] = summary["pending"]
+        return counts
+
+    async def close(self):
+        await self.ack()
+        if self.pubsub:
+            await self.pubsub.close()
+
+    def get_metrics(self):
+        return {"delivered": self.delivered, "acked": self.acked, "claimed": self.claimed, "buffered": len(self.buffer)}
+
 class RedisClient:
     def __init__(self):
         self.redis = None
+        self.pool = None
+        self.publisher = None
+        self.codecs = ChannelCodecs(settings.REDIS_CHANNEL_CODECS)
+        self.routes = {} # {channel: (stream key or None, mirror to pub/sub)}
+        self.local = None
+        if settings.BUS_TRANSPORT == "inprocess":
+            # Agents talk through Python objects; Redis only carries bridged channels
+            self.local = InProcessBus(
+                bridge=self._publish_remote,
+                bridge_patterns=settings.BUS_BRIDGE_PATTERNS,
+                maxsize=settings.BUS_QUEUE_SIZE
+            )
 
     async def connect(self):
         """Connect to Redis"""
@@ -15,12 +409,23 @@ class RedisClient:
             return
 
         try:
-            self.redis = redis.Redis(
+            # Explicitly sized pool; every pub/sub subscription holds one connection
+            self.pool = redis.ConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
-                decode_responses=True
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                decode_responses=False # Payloads may be binary (msgpack); see get()/Subscription
             )
+            self.redis = redis.Redis(connection_pool=self.pool)
             await self.redis.ping()
+            self.publisher = BatchPublisher(
+                self.redis,
+                max_batch=settings.REDIS_PUBLISH_BATCH,
+                linger=settings.REDIS_PUBLISH_LINGER_US / 1_000_000,
+                max_pending=settings.REDIS_PUBLISH_MAX_PENDING,
+                send=self._send
+            )
+            self.publisher.start()
             logger.info("✅ Connected to Redis")
         except Exception as e:
             logger.error(f"❌ Failed to connect to Redis: {e}")
@@ -28,24 +433,127 @@ class RedisClient:
 
     async def disconnect(self):
         """Close Redis connection"""
+        if self.publisher:
+            await self.publisher.stop()
+            self.publisher = None
         if self.redis:
             await self.redis.close()
+            await self.pool.disconnect()
+            self.redis = None
             logger.info("✅ Disconnected from Redis")
 
+    def route(self, channel):
+        """Returns (stream key or None, mirror to pub/sub) for a channel.
+
+        In 'streams' transport mode each family in settings.STREAM_FAMILIES
+        gets one stream ('ticks:*' -> 'stream:ticks') so pattern consumers
+        read a single key. Mirrored channels are also PUBLISHed so pub/sub
+        readers like the dashboard keep working.
+        """
+        route = self.routes.get(channel)
+        if route is None:
+            stream = None
+            mirror = False
+            if settings.BUS_TRANSPORT == "streams":
+                family = channel.split(":", 1)[0]
+                if family in settings.STREAM_FAMILIES:
+                    stream = f"stream:{family}"
+                    mirror = any(fnmatch.fnmatchcase(channel, p) for p in settings.STREAM_PUBSUB_MIRROR)
+            route = self.routes[channel] = (stream, mirror)
+        return route
+
+    def stream_for(self, channel):
+        return self.route(channel)[0]
+
+    def _send(self, target, channel, message):
+        """Queue one message on a client or pipeline; returns the awaitable(s)."""
+        stream, mirror = self.route(channel)
+        if stream is None:
+            return [target.publish(channel, message)]
+        sends = [target.xadd(
+            stream, {"c": channel, "d": message},
+            maxlen=settings.STREAM_MAXLEN, approximate=True
+        )]
+        if mirror:
+            sends.append(target.publish(channel, message))
+        return sends
+
     async def publish(self, channel, message):
-        """Publish a message to a channel"""
-        if isinstance(message, dict):
-            message = json.dumps(message)
-        await self.redis.publish(channel, message)
-
-    async def subscribe(self, channel):
-        """Subscribe to a channel (supports patterns)"""
-        pubsub = self.redis.pubsub()
-        if "*" in channel:
-            await pubsub.psubscribe(channel)
+        """Publish a message to a channel (dicts are encoded with the channel's codec)"""
+        if self.local:
+            await self.local.publish(channel, message)
+            return
+        for send in self._send(self.redis, channel, self.codecs.encode(channel, message)):
+            await send
+
+    async def publish_batched(self, channel, message):
+        """Queue a message for a pipelined flush (high-volume paths like ticks)."""
+        if self.local:
+            await self.local.publish(channel, message)
+            return
+        await self._publish_remote(channel, message)
+
+    async def _publish_remote(self, channel, message):
+        """Encode and queue a message for Redis (also the in-process bus bridge)."""
+        message = self.codecs.encode(channel, message)
+        if self.publisher:
+            await self.publisher.publish(channel, message)
         else:
-            await pubsub.subscribe(channel)
-        return pubsub
+            for send in self._send(self.redis, channel, message):
+                await send
+
+    def get_metrics(self):
+        return {
+            "transport": settings.BUS_TRANSPORT,
+            "publisher": self.publisher.get_metrics() if self.publisher else None,
+            "local_bus": self.local.get_metrics() if self.local else None
+        }
+
+    async def subscribe(self, *channels, group=None):
+        """Subscribe to one or more channels (supports patterns)
+
+        With BUS_TRANSPORT=streams and a consumer `group` (usually the agent
+        name), stream-backed channels are read through a consumer group so
+        nothing is lost while the consumer is slow or restarting, and
+        processes sharing a group split the load.
+        """
+        if self.local:
+            return await self.local.subscribe(*channels)
+
+        streams = {}
+        plain = []
+        for channel in channels:
+            stream = self.stream_for(channel) if group else None
+            if stream:
+                streams.setdefault(stream, []).append(channel)
+            else:
+                plain.append(channel)
+
+        pubsub = None
+        if plain:
+            pubsub = self.redis.pubsub()
+            for channel in plain:
+                if "*" in channel:
+                    await pubsub.psubscribe(channel)
+                else:
+                    await pubsub.subscribe(channel)
+            pubsub = Subscription(pubsub)
+        if not streams:
+            return pubsub
+
+        # Unique per process: a shared name would mean a shared pending list
+        consumer = f"{settings.STREAM_CONSUMER_NAME or group}-{socket.gethostname()}-{os.getpid()}"
+        subscription = StreamSubscription(
+            self.redis, streams, group, consumer, pubsub=pubsub,
+            batch=settings.STREAM_BATCH, block_ms=settings.STREAM_BLOCK_MS,
+            claim_idle_ms=settings.STREAM_CLAIM_IDLE_MS, claim_interval=settings.STREAM_CLAIM_INTERVAL
+        )
+        await subscription.setup()
+        return subscription
+
+    def decode(self, message):
+        """Decode a subscription message's payload (JSON or msgpack, by sniffing)."""
+        return decode_payload(message['data'])
 
     async def set(self, key, value, expire=None):
         """Set a key-value pair"""
@@ -53,6 +561,7 @@ class RedisClient:
 
     async def get(self, key):
         """Get a value by key"""
-        return await self.redis.get(key)
+        value = await self.redis.get(key)
+        return value.decode() if isinstance(value, bytes) else value
 
 redis_client = RedisClient()
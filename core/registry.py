@@ -0,0 +1,74 @@
+import importlib
+import logging
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# name -> where the agent lives and what it does for the brain.
+# Modules are only imported when the agent is enabled, so disabled agents
+# never pull in Playwright, asyncpraw, etc. "start_timeout" (seconds)
+# overrides settings.AGENT_START_TIMEOUT for slow starters.
+AGENT_SPECS = {
+    "finnhub_agent": {"module": "agents.finnhub_agent", "cls": "FinnhubWebSocketAgent", "role": "data"},
+    "bar_agent": {"module": "agents.bar_agent", "cls": "BarAgent", "role": "data"},
+    "alpha_vantage_agent": {"module": "agents.alpha_vantage_agent", "cls": "AlphaVantageAgent", "role": "data"},
+    "vision_agent": {"module": "agents.vision_agent", "cls": "InvestingChartVisionAgent", "role": "analysis", "start_timeout": 60},
+    "indicator_agent": {"module": "agents.indicator_agent", "cls": "IndicatorAgent", "role": "analysis"},
+    "technical_agent": {"module": "agents.technical_agent", "cls": "TechnicalAnalysisAgent", "role": "analysis"},
+    "sentiment_agent": {"module": "agents.sentiment_agent", "cls": "SentimentAgent", "role": "analysis"},
+    "execution_agent": {"module": "agents.execution_agent", "cls": "ExnessExecutionAgent", "role": "execution", "start_timeout": 180}, # Login may wait on a manual CAPTCHA
+    "risk_agent": {"module": "agents.risk_agent", "cls": "DynamicRiskAgent", "role": "risk"},
+    "session_agent": {"module": "agents.session_agent", "cls": "SessionAgent", "role": "market"},
+    "news_agent": {"module": "agents.news_agent", "cls": "NewsAgent", "role": "analysis"},
+    "social_agent": {"module": "agents.social_agent", "cls": "SocialAgent", "role": "analysis"},
+    "correlation_agent": {"module": "agents.correlation_agent", "cls": "CorrelationAgent", "role": "market"},
+    "volatility_agent": {"module": "agents.volatility_agent", "cls": "VolatilityAgent", "role": "market"},
+    "signal_recorder": {"module": "agents.signal_recorder_agent", "cls": "SignalRecorderAgent", "role": "storage"},
+}
+
+class AgentRegistry:
+    """Builds enabled agents on demand and resolves them by name or role."""
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = list(AGENT_SPECS)
+        self.enabled = []
+        for name in enabled:
+            if name in AGENT_SPECS:
+                self.enabled.append(name)
+            else:
+                logger.warning(f"⚠️ Unknown agent '{name}' in ENABLED_AGENTS, ignoring.")
+        self.agents = {} # {name: instance}
+        self.roles = {} # {role: [instance, ...]}
+
+    def get(self, name):
+        """Return the agent instance, importing and constructing it on first use."""
+        agent = self.agents.get(name)
+        if agent is not None or name not in self.enabled:
+            return agent
+
+        spec = AGENT_SPECS[name]
+        module = importlib.import_module(spec["module"])
+        agent = getattr(module, spec["cls"])()
+        self.agents[name] = agent
+        self.roles.setdefault(spec["role"], []).append(agent)
+        return agent
+
+    def build(self):
+        """Construct every enabled agent. Returns them in configuration order."""
+        return [self.get(name) for name in self.enabled]
+
+    def local_indicators(self):
+        """True when bars and indicators are both built in-process."""
+        return "bar_agent" in self.enabled and "indicator_agent" in self.enabled
+
+    def by_role(self, role):
+        """First constructed agent with this role, or None."""
+        agents = self.roles.get(role)
+        return agents[0] if agents else None
+
+    def start_timeout(self, name):
+        return AGENT_SPECS[name].get("start_timeout", settings.AGENT_START_TIMEOUT)
+
+    def all(self):
+        return list(self.agents.values())
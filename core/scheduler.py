@@ -7,6 +7,18 @@ class MarketScheduler:
     def __init__(self):
         self.timezone = pytz.UTC
 
+    def fx_open(self, now=None):
+        """True while the FX market trades: Sunday 22:00 to Friday 22:00 UTC."""
+        now = now or datetime.datetime.now(self.timezone)
+        weekday = now.weekday() # 0=Mon, 6=Sun
+        if weekday == 5:
+            return False
+        if weekday == 4:
+            return now.hour < 22
+        if weekday == 6:
+            return now.hour >= 22
+        return True
+
     def get_active_session(self):
         """Get current market session."""
         now = datetime.datetime.now(self.timezone)
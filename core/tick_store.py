@@ -0,0 +1,189 @@
+import os
+import time
+import struct
+import logging
+from collections import OrderedDict
+from datetime import datetime
+import numpy as np
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# One fixed-width record per tick: exchange timestamp (ms), price, volume
+TICK_DTYPE = np.dtype([("ts", "<i8"), ("price", "<f8"), ("volume", "<f8")])
+RECORD = struct.Struct("<qdd")
+
+def day_of(ts_ms):
+    return datetime.utcfromtimestamp(ts_ms / 1000.0).strftime("%Y%m%d")
+
+def symbol_dir(symbol):
+    """Filesystem-safe directory name ('OANDA:EUR_USD' -> 'OANDA_EUR_USD')."""
+    return symbol.replace(":", "_").replace("/", "_")
+
+def sort_segment(path):
+    """Rewrite a segment file in timestamp order (stable: arrival order within a ms)."""
+    ticks = np.fromfile(path, dtype=TICK_DTYPE)
+    tmp = path + ".tmp"
+    ticks[np.argsort(ticks["ts"], kind="stable")].tofile(tmp)
+    os.replace(tmp, path)
+
+class TickStore:
+    """
+    Append-only tick history on local disk: data/ticks/{symbol}/{YYYYMMDD}.bin.
+    Segments roll daily (UTC, by tick timestamp); reads are memory-mapped
+    NumPy views with binary search on the timestamp column. Ticks keep
+    their real timestamps; a segment that received one out of order is
+    re-sorted when it rolls (reads of today's segment sort a copy meanwhile).
+    """
+    def __init__(self, root=None, flush_interval=1.0, max_maps=None):
+        self.root = root or settings.TICK_STORE_DIR
+        self.flush_interval = flush_interval
+        self.max_maps = max_maps or settings.TICK_STORE_MAX_MAPS
+        self.files = {} # symbol -> [day, file handle, newest ts, in order]
+        self.maps = OrderedDict() # path -> memmap of a closed (past) segment, least recently used first
+        self.last_flush = time.monotonic()
+        self.appended = 0
+        self.reordered = 0
+        self.dropped = 0
+
+    def path(self, symbol, day):
+        return os.path.join(self.root, symbol_dir(symbol), f"{day}.bin")
+
+    def _open(self, symbol, day):
+        path = self.path(symbol, day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.maps.pop(path, None) # Writable again: drop any cached map of it
+        last_ts = None
+        if os.path.exists(path):
+            # A crash mid-write can leave a partial record: cut it off
+            size = os.path.getsize(path)
+            if size % RECORD.size:
+                with open(path, "r+b") as f:
+                    f.truncate(size - size % RECORD.size)
+            if size >= RECORD.size:
+                ts = np.fromfile(path, dtype=TICK_DTYPE)["ts"]
+                if (np.diff(ts) < 0).any():
+                    sort_segment(path) # Crashed before the segment was sorted
+                last_ts = int(ts.max())
+        return [day, open(path, "ab"), last_ts, True]
+
+    def _close(self, entry):
+        entry[1].close()
+        if not entry[3]:
+            sort_segment(entry[1].name)
+
+    def append(self, symbol, ts_ms, price, volume=0.0):
+        """Append one tick. Writes are buffered; flushed every flush_interval."""
+        ts_ms = int(ts_ms)
+        day = day_of(ts_ms)
+        entry = self.files.get(symbol)
+        if entry is None or day > entry[0]:
+            if entry:
+                self._close(entry) # Day rolled: previous segment is now immutable
+            entry = self.files[symbol] = self._open(symbol, day)
+        elif day < entry[0]:
+            # Belongs to a past (immutable) segment: count it rather than rewrite history
+            self.dropped += 1
+            return
+
+        if entry[2] is not None and ts_ms < entry[2]:
+            entry[3] = False # Stored as-is; the segment is sorted when it rolls
+            self.reordered += 1
+        else:
+            entry[2] = ts_ms
+        entry[1].write(RECORD.pack(ts_ms, float(price), float(volume or 0.0)))
+        self.appended += 1
+
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        for entry in self.files.values():
+            entry[1].flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        for entry in self.files.values():
+            self._close(entry)
+        self.files = {}
+
+    def days(self, symbol):
+        """Sorted segment days available for a symbol."""
+        folder = os.path.join(self.root, symbol_dir(symbol))
+        if not os.path.isdir(folder):
+            return []
+        return sorted(name[:-4] for name in os.listdir(folder) if name.endswith(".bin"))
+
+    def segment(self, symbol, day):
+        """Memory-mapped view of one day's ticks."""
+        path = self.path(symbol, day)
+        entry = self.files.get(symbol)
+        live = entry is not None and entry[0] == day
+        if live:
+            entry[1].flush()
+        elif path in self.maps:
+            self.maps.move_to_end(path)
+            return self.maps[path]
+
+        count = os.path.getsize(path) // RECORD.size if os.path.exists(path) else 0
+        if count == 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        view = np.memmap(path, dtype=TICK_DTYPE, mode="r", shape=(count,))
+        if live:
+            if not entry[3]:
+                # Out-of-order ticks since the last roll: search a sorted copy
+                return view[np.argsort(view["ts"], kind="stable")]
+            return view
+        self.maps[path] = view # Past segments never change
+        if len(self.maps) > self.max_maps:
+            # Unmapped once the caller's views of it are gone too
+            self.maps.popitem(last=False)
+        return view
+
+    def read(self, symbol, start_ms=None, end_ms=None):
+        """
+        Ticks with start_ms <= ts < end_ms as a structured array
+        (fields ts, price, volume). A single-day range is a zero-copy view.
+        """
+        first = day_of(start_ms) if start_ms is not None else None
+        last = day_of(end_ms - 1) if end_ms is not None else None
+        parts = []
+        for day in self.days(symbol):
+            if (first and day < first) or (last and day > last):
+                continue
+            ticks = self.segment(symbol, day)
+            lo = np.searchsorted(ticks["ts"], start_ms, "left") if start_ms is not None else 0
+            hi = np.searchsorted(ticks["ts"], end_ms, "left") if end_ms is not None else len(ticks)
+            if hi > lo:
+                parts.append(ticks[lo:hi])
+
+        if not parts:
+            return np.empty(0, dtype=TICK_DTYPE)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def tail(self, symbol, count):
+        """Most recent `count` ticks (searches back across day segments)."""
+        parts = []
+        needed = count
+        if needed <= 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        for day in reversed(self.days(symbol)):
+            ticks = self.segment(symbol, day)
+            parts.append(ticks[-needed:] if needed < len(ticks) else ticks)
+            needed -= len(parts[-1])
+            if needed <= 0:
+                break
+        if not parts:
+            return np.empty(0, dtype=TICK_DTYPE)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts[::-1])
+
+    def get_metrics(self):
+        return {
+            "appended": self.appended,
+            "reordered": self.reordered,
+            "dropped": self.dropped,
+            "open_segments": len(self.files),
+            "mapped_segments": len(self.maps)
+        }
+
+tick_store = TickStore()
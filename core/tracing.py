@@ -0,0 +1,100 @@
+import time
+import uuid
+import logging
+import itertools
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# A trace rides inside every published payload under "trace":
+#   {"id": "9f2c...", "stages": [["tick", 1732600000123.0], ["ingest", ...], ...]}
+# Stages are appended in order with wall-clock milliseconds, so any process
+# on the bus can extend it and the brain can measure tick -> order.
+
+# Trace ids: a per-process prefix plus a counter (every tick starts a trace,
+# so this avoids a uuid4 per tick while staying unique across processes)
+_TRACE_PREFIX = uuid.uuid4().hex[:8]
+_trace_ids = itertools.count()
+
+def now_ms():
+    return time.time() * 1000
+
+def start_trace(payload, stage, ts=None):
+    """Attach a new trace to an outgoing payload, starting at `stage`."""
+    payload["trace"] = {
+        "id": f"{_TRACE_PREFIX}{next(_trace_ids):x}",
+        "stages": [[stage, now_ms() if ts is None else ts]]
+    }
+    return payload
+
+def continue_trace(payload, source, stage):
+    """Carry the trace of an incoming payload (`source`) into an outgoing one."""
+    trace = source.get("trace") if isinstance(source, dict) else None
+    if not trace:
+        return start_trace(payload, stage)
+    payload["trace"] = {"id": trace["id"], "stages": list(trace["stages"])}
+    mark(payload["trace"], stage)
+    return payload
+
+def mark(trace, stage):
+    """Record that `stage` was reached now. Accepts a trace dict or None."""
+    if trace:
+        trace["stages"].append([stage, now_ms()])
+    return trace
+
+class LatencyHistogram:
+    """Latency samples (ms) in a bounded reservoir with percentile queries."""
+    def __init__(self, size=2048):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+
+    def percentiles(self):
+        if not self.samples:
+            return {"count": 0}
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {
+            "count": self.count,
+            "p50": round(ordered[int(last * 0.50)], 3),
+            "p95": round(ordered[int(last * 0.95)], 3),
+            "p99": round(ordered[int(last * 0.99)], 3),
+            "max": round(ordered[-1], 3)
+        }
+
+class Tracer:
+    """Per-stage and per-pair latency histograms built from finished traces."""
+    def __init__(self):
+        self.histograms = {} # {(stage, pair): LatencyHistogram}, pair "*" = all pairs
+
+    def observe(self, stage, pair, value):
+        for key in ((stage, pair), (stage, "*")):
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.add(value)
+
+    def record(self, trace, pair):
+        """Fold a finished trace into the histograms (each trace counts once)."""
+        if not trace or trace.get("recorded"):
+            return
+        trace["recorded"] = True
+        stages = trace["stages"]
+        for (prev, prev_ts), (stage, ts) in zip(stages, stages[1:]):
+            self.observe(f"{prev}->{stage}", pair, ts - prev_ts)
+        if len(stages) > 1:
+            self.observe(f"{stages[0][0]}->{stages[-1][0]}", pair, stages[-1][1] - stages[0][1])
+
+    def report(self, pair=None):
+        """Returns {stage: {pair: {"count", "p50", "p95", "p99", "max"}}}."""
+        report = {}
+        for (stage, key_pair), histogram in self.histograms.items():
+            if pair is not None and key_pair != pair:
+                continue
+            report.setdefault(stage, {})[key_pair] = histogram.percentiles()
+        return report
+
+tracer = Tracer()
@@ -2,33 +2,131 @@ import asyncio
 import sys
 import os
 import logging
+import logging.handlers
+import queue
+import threading
+import time
 from colorama import init, Fore, Style
 
 import redis
 
+from config.settings import settings
+
 # Initialize colorama
 init(autoreset=True)
 
-class RedisLogHandler(logging.Handler):
-    """Publishes logs to Redis for the Dashboard."""
-    def __init__(self):
-        super().__init__()
+class RedisLogHandler(logging.handlers.QueueHandler):
+    """
+    Publishes logs to Redis for the Dashboard without blocking the caller.
+    emit() only formats and enqueues; a listener thread batches to Redis.
+    """
+    def __init__(self, maxsize=10000, rate=50.0, burst=200):
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {} # logger name -> [tokens, last refill]
+        self.dropped = 0 # Queue full
+        self.rate_limited = 0 # Over a logger's budget
+        self.listener = None
+
+    def allow(self, record):
+        """Token bucket per logger; errors always get through."""
+        if record.levelno >= logging.ERROR or self.rate <= 0:
+            return True
+        now = time.monotonic()
+        bucket = self.buckets.get(record.name)
+        if bucket is None:
+            bucket = self.buckets[record.name] = [self.burst, now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+    def emit(self, record):
+        if not self.allow(record):
+            self.rate_limited += 1
+            return
         try:
-            self.redis = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
+            self.enqueue(self.prepare(record))
+        except queue.Full:
+            self.dropped += 1
         except Exception:
-            self.redis = None
-    
-    def emit(self, record):
-        if not self.redis: return
+            self.handleError(record)
+
+    def start(self, host, port, batch_size=200):
+        self.listener = RedisLogListener(self, host, port, batch_size)
+        self.listener.start()
+
+    def close(self):
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+    def get_metrics(self):
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped,
+            "rate_limited": self.rate_limited,
+            "published": self.listener.published if self.listener else 0
+        }
+
+class RedisLogListener(threading.Thread):
+    """Drains the handler queue and publishes records in pipelined batches."""
+    def __init__(self, handler, host, port, batch_size=200):
+        super().__init__(name="redis-log-listener", daemon=True)
+        self.handler = handler
+        self.batch_size = batch_size
+        self.redis = redis.Redis(host=host, port=port, db=0, decode_responses=True)
+        self.stopping = threading.Event()
+        self.published = 0
+        self.reported_drops = 0
+
+    def run(self):
+        q = self.handler.queue
+        while not (self.stopping.is_set() and q.empty()):
+            try:
+                batch = [q.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            self.publish(batch)
+
+    def publish(self, batch):
+        drops = self.handler.dropped + self.handler.rate_limited
         try:
-            msg = self.format(record)
-            self.redis.publish("logs", msg)
+            pipe = self.redis.pipeline(transaction=False)
+            for record in batch:
+                pipe.publish("logs", record.msg)
+            if drops > self.reported_drops:
+                pipe.publish("logs", f"⚠️ {drops - self.reported_drops} log records dropped (queue full or rate limited)")
+            pipe.execute()
+            self.published += len(batch)
+            self.reported_drops = drops
         except Exception:
-            pass
+            # Redis down: lose this batch rather than back up the queue
+            self.handler.dropped += len(batch)
+            self.stopping.wait(1.0)
+
+    def stop(self, timeout=2.0):
+        self.stopping.set()
+        self.join(timeout)
 
 # Configure Logging to Redis
-redis_handler = RedisLogHandler()
+redis_handler = RedisLogHandler(
+    maxsize=settings.LOG_QUEUE_SIZE,
+    rate=settings.LOG_RATE_PER_LOGGER,
+    burst=settings.LOG_RATE_BURST
+)
 redis_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+redis_handler.start(settings.REDIS_HOST, settings.REDIS_PORT, settings.LOG_PUBLISH_BATCH)
 logging.getLogger().addHandler(redis_handler)
 
 async def main():
@@ -55,7 +153,6 @@ async def main():
             return
             
         # Verify Credentials
-        from config.settings import settings
         if not settings.EXNESS_EMAIL or not settings.EXNESS_PASSWORD:
             print(Fore.RED + "❌ Error: Exness credentials missing in .env")
             return
@@ -0,0 +1,82 @@
+import asyncio
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bars import BarSeries, BarAggregator
+from colorama import Fore, Style, init
+
+init()
+
+async def test_bars():
+    print(f"{Fore.CYAN}🔍 Testing Bar Aggregation...{Style.RESET_ALL}\n")
+
+    # Open/close: a tick in the next period closes the bar with its OHLCV
+    series = BarSeries(1000, capacity=3)
+    assert series.update(100, 1.0, 2.0) is None
+    assert series.update(400, 1.5, 1.0) is None
+    assert series.update(600, 0.5, 1.0) is None
+    assert series.update(900, 1.2, 1.0) is None
+    bar = series.update(1100, 1.3, 1.0)
+    assert (bar["start"], bar["end"]) == (0, 1000)
+    assert (bar["open"], bar["high"], bar["low"], bar["close"]) == (1.0, 1.5, 0.5, 1.2)
+    assert bar["volume"] == 5.0 and bar["ticks"] == 4
+    print("   ✅ Bar closes on the next period's tick")
+
+    # A late tick for the closed bar is dropped, not folded into the open one
+    assert series.update(950, 9.9) is None
+    assert series.late == 1
+    assert series.high == 1.3
+    print("   ✅ Late tick dropped")
+
+    # Duplicate-bar case: flush closes the bar, then a late tick for it
+    # arrives; it must not re-open and publish start=0 a second time
+    series = BarSeries(1000)
+    closed = []
+    for ts in (100, 900):
+        closed.append(series.update(ts, 1.0))
+    closed.append(series.flush(1300))
+    closed.append(series.update(950, 1.1))
+    closed.append(series.update(1100, 1.2))
+    closed.append(series.update(2100, 1.3))
+    starts = [bar["start"] for bar in closed if bar]
+    assert starts == [0, 1000], starts
+    assert series.late == 1
+    print(f"   ✅ No duplicate bar after flush (closed starts: {starts})")
+
+    # Ring keeps the newest `capacity` bars, oldest first
+    series = BarSeries(1000, capacity=3)
+    for i in range(6):
+        series.update(i * 1000, float(i))
+    held = series.last(10)
+    assert list(held["start"]) == [2000, 3000, 4000]
+    assert list(held["close"]) == [2.0, 3.0, 4.0]
+    assert list(series.last(2)["start"]) == [3000, 4000]
+    print("   ✅ Ring buffer last()")
+
+    # Feed gap: overlapping closed bars and the open bar are flagged dirty
+    marked = series.mark_dirty(3500, 5200)
+    held = series.last(3)
+    assert marked == 3 # bars 3000, 4000 + the open 5000 bar
+    assert list(held["dirty"]) == [False, True, True]
+    assert series.dirty
+    print("   ✅ mark_dirty flags gap bars")
+
+    # Flush runs in exchange time: local clock minus observed lag and grace
+    aggregator = BarAggregator(["1s"], capacity=10, grace_ms=100)
+    aggregator.on_tick("OANDA:EUR_USD", 500, 1.0)
+    aggregator.observe_lag("OANDA:EUR_USD", 2000)
+    assert aggregator.flush(2500) == [] # Exchange time is only ~400ms
+    assert aggregator.flush(3200) != [] # ~1100ms: the 0-1000 bar is over
+    aggregator.observe_lag("OANDA:EUR_USD", 0)
+    assert 0 < aggregator.lag["OANDA:EUR_USD"] < 2000 # Decays, doesn't drop to 0
+    assert aggregator.on_tick("OANDA:EUR_USD", 800, 1.0) == []
+    assert aggregator.late_ticks() == 1
+    print("   ✅ Lag-based flush")
+
+    print(f"\n{Fore.GREEN}✅ Bar Aggregation Test Complete.{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_bars())
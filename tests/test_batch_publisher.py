@@ -0,0 +1,76 @@
+import asyncio
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.redis_client import BatchPublisher
+from colorama import Fore, Style, init
+
+init()
+
+class SlowRedis:
+    """Pipelines that take `delay` seconds per round trip and record what arrived."""
+    def __init__(self, delay):
+        self.delay = delay
+        self.received = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def pipeline(self, transaction=False):
+        return SlowPipeline(self)
+
+class SlowPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    def publish(self, channel, message):
+        self.queued.append((channel, message))
+
+    async def execute(self):
+        self.client.in_flight += 1
+        self.client.max_in_flight = max(self.client.max_in_flight, self.client.in_flight)
+        await asyncio.sleep(self.client.delay)
+        self.client.received.extend(self.queued)
+        self.client.in_flight -= 1
+
+async def test_batch_publisher():
+    print(f"{Fore.CYAN}🔍 Testing Batch Publisher...{Style.RESET_ALL}\n")
+
+    # Backpressure: inline flushes while the timed flush is mid-pipeline
+    redis = SlowRedis(delay=0.005)
+    publisher = BatchPublisher(redis, max_batch=8, linger=0.001, max_pending=20)
+    publisher.start()
+    for i in range(500):
+        await publisher.publish("ticks:OANDA:EUR_USD", i)
+        if i % 50 == 0:
+            await asyncio.sleep(0.002)
+    await publisher.stop()
+
+    received = [message for _, message in redis.received]
+    assert received == list(range(500)), "ticks reordered or lost"
+    assert redis.max_in_flight == 1
+    print(f"   ✅ 500 ticks in order, one pipeline at a time ({publisher.flushes} flushes)")
+
+    # stop() while a pipeline is in flight, with more buffered behind it
+    redis = SlowRedis(delay=0.05)
+    publisher = BatchPublisher(redis, max_batch=256, linger=0.0)
+    publisher.start()
+    for i in range(10):
+        await publisher.publish("ticks:OANDA:EUR_USD", i)
+    await asyncio.sleep(0.01) # First flush is now inside execute()
+    for i in range(10, 15):
+        await publisher.publish("ticks:OANDA:EUR_USD", i)
+    await publisher.stop()
+
+    received = [message for _, message in redis.received]
+    assert received == list(range(15)), received
+    assert publisher.task is None and not publisher.pending
+    print("   ✅ stop() keeps the in-flight batch and flushes the rest")
+
+    print(f"\n{Fore.GREEN}✅ Batch Publisher Test Complete.{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_batch_publisher())
@@ -0,0 +1,77 @@
+import asyncio
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.brain import MainBrain, Signal
+from core.replay import SimClock, NullBus, StubRiskAgent
+from colorama import Fore, Style, init
+
+init()
+
+class SlowExecutionAgent:
+    """Order placement that takes `seconds` of simulated time per order."""
+    def __init__(self, clock, seconds):
+        self.clock = clock
+        self.seconds = seconds
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fills = []
+
+    async def place_order(self, symbol, side, volume, stop_loss=None, take_profit=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.clock.now += self.seconds
+        self.fills.append((symbol, side))
+        self.in_flight -= 1
+        return True
+
+async def test_execution_lock():
+    print(f"{Fore.CYAN}🔍 Testing Serialized Order Placement...{Style.RESET_ALL}\n")
+
+    clock = SimClock(1000.0)
+    brain = MainBrain(enabled_agents=[], bus=NullBus(), clock=clock)
+    brain.risk_agent = StubRiskAgent()
+    execution = brain.execution_agent = SlowExecutionAgent(clock, seconds=30)
+
+    def vote(pair, side):
+        brain.signal_buffer.add(Signal.from_message(
+            {"agent": "technical_agent", "pair": pair, "signal": side, "confidence": 0.9}, clock.now
+        ))
+
+    # Both pairs clear the threshold at once; EUR/USD's order takes 30s of
+    # simulated time, so GBP/USD's 10s-window votes are gone when it gets the lock
+    vote("EUR/USD", "BUY")
+    vote("GBP/USD", "SELL")
+    await asyncio.gather(brain.process_voting("EUR/USD"), brain.process_voting("GBP/USD"))
+
+    assert execution.max_in_flight == 1
+    assert execution.fills == [("EUR/USD", "BUY")], execution.fills
+    assert brain.stale_decisions == 1
+    print(f"   ✅ One order at a time; stale GBP/USD SELL dropped (fills: {execution.fills})")
+
+    # Still valid after the wait: both orders go through, one after the other
+    execution.seconds = 1
+    vote("EUR/USD", "SELL")
+    vote("GBP/USD", "BUY")
+    await asyncio.gather(brain.process_voting("EUR/USD"), brain.process_voting("GBP/USD"))
+
+    assert execution.max_in_flight == 1
+    assert execution.fills[1:] == [("EUR/USD", "SELL"), ("GBP/USD", "BUY")], execution.fills
+    assert brain.stale_decisions == 1
+    print("   ✅ Decisions that still hold are executed after the wait")
+
+    # No risk approval, no order
+    brain.risk_agent = None
+    vote("USD/JPY", "BUY")
+    await brain.process_voting("USD/JPY")
+    assert len(execution.fills) == 3
+    print("   ✅ No order without a risk check")
+
+    print(f"\n{Fore.GREEN}✅ Serialized Order Placement Test Complete.{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_execution_lock())
@@ -0,0 +1,146 @@
+import asyncio
+import math
+import random
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.indicators import EMA, Wilder, RSI, ATR, Bollinger, MACD, IndicatorSet
+from colorama import Fore, Style, init
+
+init()
+
+# Straightforward full-history reference implementations
+
+def ref_ema(values, period):
+    out = [None] * len(values)
+    if len(values) < period:
+        return out
+    ema = sum(values[:period]) / period
+    out[period - 1] = ema
+    for i in range(period, len(values)):
+        ema = values[i] * 2 / (period + 1) + ema * (1 - 2 / (period + 1))
+        out[i] = ema
+    return out
+
+def ref_wilder(values, period):
+    out = [None] * len(values)
+    if len(values) < period:
+        return out
+    avg = sum(values[:period]) / period
+    out[period - 1] = avg
+    for i in range(period, len(values)):
+        avg = (avg * (period - 1) + values[i]) / period
+        out[i] = avg
+    return out
+
+def ref_rsi(closes, period):
+    changes = [b - a for a, b in zip(closes, closes[1:])]
+    gains = ref_wilder([max(c, 0.0) for c in changes], period)
+    losses = ref_wilder([max(-c, 0.0) for c in changes], period)
+    out = [None]
+    for gain, loss in zip(gains, losses):
+        if gain is None:
+            out.append(None)
+        elif loss == 0:
+            out.append(100.0)
+        else:
+            out.append(100 - 100 / (1 + gain / loss))
+    return out
+
+def ref_atr(bars, period):
+    ranges = []
+    for i, (high, low, close) in enumerate(bars):
+        if i == 0:
+            ranges.append(high - low)
+        else:
+            prev = bars[i - 1][2]
+            ranges.append(max(high - low, abs(high - prev), abs(low - prev)))
+    return ref_wilder(ranges, period)
+
+def ref_bollinger(values, period, k):
+    out = [None] * len(values)
+    for i in range(period - 1, len(values)):
+        window = values[i - period + 1:i + 1]
+        mean = sum(window) / period
+        std = math.sqrt(sum((x - mean) ** 2 for x in window) / period)
+        out[i] = (mean, mean + k * std, mean - k * std)
+    return out
+
+def ref_macd(values, fast, slow, signal):
+    fast_ema = ref_ema(values, fast)
+    slow_ema = ref_ema(values, slow)
+    lines = [f - s for f, s in zip(fast_ema, slow_ema) if f is not None and s is not None]
+    signals = ref_ema(lines, signal)
+    out = [None] * (len(values) - len(lines))
+    for line, sig in zip(lines, signals):
+        out.append(None if sig is None else (line, sig, line - sig))
+    return out
+
+def close_to(a, b, tol=1e-9):
+    if a is None or b is None:
+        return a is None and b is None
+    if isinstance(a, tuple):
+        return all(close_to(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def check(name, streamed, expected):
+    assert len(streamed) == len(expected)
+    for i, (got, want) in enumerate(zip(streamed, expected)):
+        assert close_to(got, want), f"{name} bar {i}: {got} != {want}"
+    warm = next(i for i, v in enumerate(expected) if v is not None)
+    print(f"   ✅ {name} matches reference ({len(expected)} bars, warm after {warm + 1})")
+
+async def test_indicators():
+    print(f"{Fore.CYAN}🔍 Testing Incremental Indicators...{Style.RESET_ALL}\n")
+
+    rng = random.Random(7)
+    closes, bars = [], []
+    price = 1.1000
+    for _ in range(200):
+        price += rng.uniform(-0.002, 0.002)
+        high = price + rng.uniform(0, 0.001)
+        low = price - rng.uniform(0, 0.001)
+        closes.append(price)
+        bars.append((high, low, price))
+
+    ema = EMA(20)
+    check("EMA(20)", [ema.update(x) for x in closes], ref_ema(closes, 20))
+
+    wilder = Wilder(14)
+    check("Wilder(14)", [wilder.update(x) for x in closes], ref_wilder(closes, 14))
+
+    rsi = RSI(14)
+    check("RSI(14)", [rsi.update(x) for x in closes], ref_rsi(closes, 14))
+
+    atr = ATR(14)
+    check("ATR(14)", [atr.update(*bar) for bar in bars], ref_atr(bars, 14))
+
+    bollinger = Bollinger(20, 2.0)
+    check("Bollinger(20, 2)", [bollinger.update(x) for x in closes], ref_bollinger(closes, 20, 2.0))
+
+    macd = MACD(12, 26, 9)
+    check("MACD(12, 26, 9)", [macd.update(x) for x in closes], ref_macd(closes, 12, 26, 9))
+
+    # Textbook edge: only gains -> RSI pinned at 100
+    rsi = RSI(3)
+    for x in (1.0, 2.0, 3.0, 4.0):
+        value = rsi.update(x)
+    assert value == 100.0
+    print("   ✅ RSI is 100 with no losses")
+
+    # A dirty (gap) bar taints output until every indicator has washed it out
+    indicators = IndicatorSet()
+    for i, (high, low, close) in enumerate(bars[:60]):
+        values = indicators.update({"high": high, "low": low, "close": close, "dirty": i == 40})
+    assert set(values) == {"RSI", "EMA", "ATR", "BBANDS", "MACD"}
+    assert values["EMA"]["period"] == 20
+    assert indicators.dirty == indicators.settle - 19
+    print(f"   ✅ IndicatorSet warm-up and dirty countdown ({indicators.dirty} bars left)")
+
+    print(f"\n{Fore.GREEN}✅ Indicator Test Complete.{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_indicators())
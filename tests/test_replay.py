@@ -0,0 +1,37 @@
+import asyncio
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.replay import ReplayEngine
+from colorama import Fore, Style, init
+
+init()
+
+async def test_replay():
+    print(f"{Fore.CYAN}🔍 Testing Offline Signal Replay...{Style.RESET_ALL}\n")
+
+    # No Redis, database, browser or LLM needed
+    records = [
+        (1000.0, "ticks:OANDA:EUR_USD", {"symbol": "OANDA:EUR_USD", "price": 1.0850}),
+        (1001.0, "signals:technical:EUR/USD", {"agent": "technical_agent", "pair": "EUR/USD", "signal": "BUY", "confidence": 0.9}),
+        (1002.0, "signals:sentiment:EUR/USD", {"agent": "sentiment_agent", "pair": "EUR/USD", "sentiment": "BULLISH", "confidence": 0.8}),
+        # Outside the 10s window of the first two: a lone SELL
+        (1020.0, "signals:technical:EUR/USD", {"agent": "technical_agent", "pair": "EUR/USD", "signal": "SELL", "confidence": 0.4}),
+    ]
+
+    engine = ReplayEngine(window_seconds=10)
+    report = await engine.run(records)
+
+    print(f"   Evaluations: {report['evaluations']} | Decisions: {report['decisions']} | Fills: {len(report['fills'])}")
+    assert report['messages'] == 4
+    assert report['evaluations'] == 3
+    assert report['fills'][0]['side'] == "BUY"
+    assert report['fills'][0]['price'] == 1.0850
+
+    print(f"\n{Fore.GREEN}✅ Replay Test Complete ({report['messages_per_second']:.0f} msg/s).{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_replay())
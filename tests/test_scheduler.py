@@ -0,0 +1,39 @@
+import asyncio
+import datetime
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scheduler import MarketScheduler
+from colorama import Fore, Style, init
+
+init()
+
+def utc(day, hour, minute=0):
+    # 2026-10-12 is a Monday
+    return datetime.datetime(2026, 10, 12 + day, hour, minute, tzinfo=datetime.timezone.utc)
+
+async def test_scheduler():
+    print(f"{Fore.CYAN}🔍 Testing FX Market Hours...{Style.RESET_ALL}\n")
+
+    scheduler = MarketScheduler()
+    cases = [
+        (utc(0, 0), True),        # Monday midnight
+        (utc(2, 12), True),       # Wednesday midday
+        (utc(4, 21, 59), True),   # Friday, just before the close
+        (utc(4, 22), False),      # Friday 22:00: FX closed
+        (utc(4, 23, 30), False),
+        (utc(5, 12), False),      # Saturday
+        (utc(6, 21, 59), False),  # Sunday, before the open
+        (utc(6, 22), True),       # Sunday 22:00: Sydney opens
+    ]
+    for when, expected in cases:
+        assert scheduler.fx_open(when) == expected, f"{when:%a %H:%M}: expected {expected}"
+        print(f"   ✅ {when:%a %H:%M} UTC -> {'open' if expected else 'closed'}")
+
+    print(f"\n{Fore.GREEN}✅ FX Market Hours Test Complete.{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_scheduler())
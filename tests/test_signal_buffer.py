@@ -0,0 +1,78 @@
+import asyncio
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.brain import Signal, SignalBuffer
+from colorama import Fore, Style, init
+
+init()
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+async def test_signal_buffer():
+    print(f"{Fore.CYAN}🔍 Testing Signal Window...{Style.RESET_ALL}\n")
+
+    clock = FakeClock(100.0)
+    buffer = SignalBuffer(window_seconds=10, clock=clock)
+
+    def add(at, data):
+        clock.now = at
+        buffer.add(Signal.from_message(dict(data, pair="EUR/USD"), at))
+
+    add(100.0, {"agent": "technical_agent", "signal": "BUY", "confidence": 0.9})
+    add(101.0, {"agent": "sentiment_agent", "sentiment": "BULLISH", "confidence": 0.6})
+    add(102.0, {"agent": "technical_agent", "signal": "SELL", "confidence": 0.3})
+    add(103.0, {"agent": "session_agent", "state": "NEUTRAL", "confidence": 1.0}) # Not a vote
+
+    buy, sell, avg, count = buffer.get_votes("EUR/USD")
+    assert (buy, sell, count) == (2, 1, 3)
+    assert abs(avg - 0.6) < 1e-9
+    totals = buffer.get_agent_totals("EUR/USD")
+    assert totals["technical_agent"][0] == 0.9
+    assert totals["technical_agent"][1] == 0.3
+    assert totals["technical_agent"][2] == 2
+    assert totals["sentiment_agent"] == [0.6, 0.0, 1]
+    assert buffer.latest("EUR/USD").agent == "technical_agent"
+    print(f"   ✅ Running totals: {buy} BUY / {sell} SELL, avg confidence {avg:.2f}")
+
+    # At 110.5 the first vote (100.0) has left the 10s window
+    clock.now = 110.5
+    buy, sell, avg, count = buffer.get_votes("EUR/USD")
+    assert (buy, sell, count) == (1, 1, 2)
+    assert abs(avg - 0.45) < 1e-9
+    totals = buffer.get_agent_totals("EUR/USD")
+    assert totals["technical_agent"][2] == 1
+    assert abs(totals["technical_agent"][0]) < 1e-9
+    print("   ✅ Expired votes leave the totals")
+
+    # Adding a newer signal also advances the window (cutoff 102.5)
+    add(112.5, {"agent": "news_agent", "signal": "SELL", "confidence": 0.5})
+    buy, sell, avg, count = buffer.get_votes("EUR/USD")
+    assert (buy, sell, count) == (0, 1, 1)
+    assert avg == 0.5 # Window emptied before the push: totals reset exactly
+    assert set(buffer.get_agent_totals("EUR/USD")) == {"news_agent"}
+    print("   ✅ Window slides on add")
+
+    # Everything expired, then cleared
+    clock.now = 200.0
+    assert buffer.get_votes("EUR/USD") == (0, 0, 0, 0)
+    assert buffer.latest("EUR/USD") is None
+    add(200.0, {"agent": "technical_agent", "signal": "BUY", "confidence": 0.7})
+    buffer.clear("EUR/USD")
+    assert buffer.get_votes("EUR/USD") == (0, 0, 0, 0)
+    assert buffer.get_agent_totals("EUR/USD") == {}
+    assert buffer.get_votes("GBP/USD") == (0, 0, 0, 0)
+    print("   ✅ Expiry and clear")
+
+    print(f"\n{Fore.GREEN}✅ Signal Window Test Complete.{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    asyncio.run(test_signal_buffer())
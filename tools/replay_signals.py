@@ -0,0 +1,36 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# Add project root to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.replay import ReplayEngine, load_records
+
+async def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded signal stream through the brain voting logic.")
+    parser.add_argument("path", help="JSON Lines recording ({\"ts\", \"channel\", \"data\"} per line)")
+    parser.add_argument("--window", type=float, default=10, help="Signal window in seconds")
+    parser.add_argument("--lot-size", type=float, default=0.01, help="Lot size for hypothetical fills")
+    parser.add_argument("--fills", action="store_true", help="Print every hypothetical fill")
+    args = parser.parse_args()
+
+    # Voting logs one line per evaluation; keep the replay output readable
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+
+    engine = ReplayEngine(window_seconds=args.window, lot_size=args.lot_size)
+    report = await engine.run(load_records(args.path))
+
+    print(f"📼 Replayed {report['messages']} messages ({report['simulated_seconds'] / 3600:.2f}h of market time)")
+    print(f"🗳️ Evaluations: {report['evaluations']} | BUY: {report['decisions']['BUY']} | SELL: {report['decisions']['SELL']} | HOLD: {report['holds']}")
+    print(f"🚀 Hypothetical fills: {len(report['fills'])}")
+    print(f"⚡ {report['elapsed_seconds']:.2f}s wall time, {report['messages_per_second']:.0f} msg/s")
+    if args.fills:
+        for fill in report['fills']:
+            print(json.dumps(fill))
+
+if __name__ == "__main__":
+    asyncio.run(main())
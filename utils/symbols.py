@@ -0,0 +1,3 @@
+def normalize_pair(symbol):
+    """OANDA:EUR_USD -> EUR/USD (the pair format signals use)."""
+    return symbol.split(":")[-1].replace("_", "/")